@@ -1,4 +1,26 @@
-from .async_client import AsyncClient
-from .sync_client import SyncClient
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .async_client import AsyncClient
+    from .sync_client import SyncClient
 
 __all__ = ["AsyncClient", "SyncClient"]
+
+# Resolve the client classes lazily (PEP 562) so that importing light
+# submodules such as slugkit._constants or slugkit.package_data does not
+# pull in the httpx/pydantic stack.
+_LAZY_EXPORTS = {
+    "AsyncClient": "async_client",
+    "SyncClient": "sync_client",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_EXPORTS:
+        import importlib
+
+        module = importlib.import_module(f".{_LAZY_EXPORTS[name]}", __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,8 @@
+"""Dependency-free constants shared by the SDK and the CLI.
+
+Kept in a separate module so the CLI can read them at import time
+without paying for the httpx/pydantic stack that slugkit.base pulls in.
+"""
+
+DEFAULT_BATCH_SIZE = 100000
+DEFAULT_STREAM_CHUNK_SIZE = 65536
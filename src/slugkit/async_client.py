@@ -1,8 +1,11 @@
+import asyncio
+import contextlib
+import functools
 import httpx
 import os
 import logging
 
-from typing import Any, AsyncGenerator, Callable
+from typing import Any, AsyncGenerator, AsyncIterator, Callable
 
 from .base import (
     DictionaryInfo,
@@ -28,29 +31,251 @@ from .base import (
     categorize_error,
     handle_http_error,
     Endpoints,
+    check_response,
+    should_retry_error,
+    calculate_backoff_delay,
+    STATS_LIST_ADAPTER,
+    DICTIONARY_INFO_LIST_ADAPTER,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    _TTLCache,
+    cache_ttl_from_headers,
+    json_request_args,
+    json_response,
+    split_stream_lines,
+    decode_stream_lines,
 )
 
 
+# Endpoint paths hoisted to module level; enum .value lookups are
+# attribute accesses we don't need on every call.
+_FORGE = Endpoints.FORGE.value
+_PATTERN_INFO = Endpoints.PATTERN_INFO.value
+_DICTIONARY_INFO = Endpoints.DICTIONARY_INFO.value
+_DICTIONARY_TAGS = Endpoints.DICTIONARY_TAGS.value
+_STATS = Endpoints.STATS.value
+_SERIES_INFO = Endpoints.SERIES_INFO.value
+_SERIES_LIST = Endpoints.SERIES_LIST.value
+_SERIES_CREATE = Endpoints.SERIES_CREATE.value
+_SERIES_UPDATE = Endpoints.SERIES_UPDATE.value
+_SERIES_DELETE = Endpoints.SERIES_DELETE.value
+_RESET = Endpoints.RESET.value
+_PING = Endpoints.PING.value
+_KEY_INFO = Endpoints.KEY_INFO.value
+_LIMITS = Endpoints.LIMITS.value
+
+
+@functools.lru_cache(maxsize=1)
+def _default_config() -> tuple[str | None, str | None]:
+    """Resolve the default (base_url, api_key) from the environment once.
+
+    The environment does not change over a process lifetime, so repeated
+    AsyncClient construction should not re-read it. Call
+    ``_default_config.cache_clear()`` if the environment is mutated in
+    tests.
+    """
+    return os.getenv("SLUGKIT_BASE_URL"), os.getenv("SLUGKIT_API_KEY")
+
+
+class _SlugStreamIterator:
+    """Reusable async iterator over a stream of decoded slug batches.
+
+    One iterator object serves the whole stream: ``__anext__`` pops from
+    the current batch synchronously and only awaits the network when the
+    local buffer runs out, instead of paying an async-generator frame
+    per slug.
+    """
+
+    __slots__ = ("_batches", "_buffer", "_index")
+
+    def __init__(self, batches: AsyncIterator[list[str]]):
+        self._batches = batches
+        self._buffer: list[str] = []
+        self._index = 0
+
+    def __aiter__(self) -> "_SlugStreamIterator":
+        return self
+
+    async def __anext__(self) -> str:
+        if self._index < len(self._buffer):
+            slug = self._buffer[self._index]
+            self._index += 1
+            return slug
+        # Empty batches are never yielded, so the first element is safe.
+        self._buffer = await self._batches.__anext__()
+        self._index = 1
+        return self._buffer[0]
+
+
 class AsyncSlugGenerator(GeneratorBase):
+    __slots__ = ()
+
+    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def __call__(self, count: int = 1) -> list[str]:
-        req = self._get_request(count)
+        req = self._get_request(count, self._sequence)
         path = self._get_path()
-        client = await self._http_client()
-        self._logger.info(f"Requesting {count} slug(s)")
+        client = self._http_client
+        self._logger.debug("Requesting %d slug(s)", count)
+        response = await client.post(path, **json_request_args(req))
+        check_response(response, "mint_slugs", path)
+        return json_response(response)
+
+    async def many(self, total: int, *, concurrency: int = 8) -> list[str]:
+        """Mint *total* slugs by issuing batch requests concurrently.
+
+        The total is split into batch-size sub-requests which run with up
+        to *concurrency* in flight at once on the shared client, so the
+        round-trips overlap instead of serializing. Results are returned
+        in submission order.
+
+        *concurrency* should not exceed the owning AsyncClient's
+        ``max_connections`` pool limit; extra tasks would only queue on
+        the pool.
+        """
+        sizes = []
+        remaining = total
+        while remaining > 0:
+            size = min(self._batch_size, remaining)
+            sizes.append(size)
+            remaining -= size
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(size: int) -> list[str]:
+            async with semaphore:
+                return await self(size)
+
+        batches = await asyncio.gather(*(fetch(size) for size in sizes))
+        return [slug for batch in batches for slug in batch]
+
+    async def slice_range(self, start: int, end: int) -> AsyncGenerator[str, Any]:
+        """Preview the slugs at sequence positions [start, end) in one request.
+
+        Streams the whole range through a single dry-run request instead
+        of paying a round-trip per client-side batch. If the server
+        rejects the range as too large, falls back to the regular batched
+        stream.
+        """
+        total = end - start
+        if total <= 0:
+            return
+        generator = self.with_dry_run().starting_from(start).with_limit(total)
         try:
-            response = await client.post(path, json=req)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "mint_slugs", path)
+            async for slug in generator.with_batch_size(total).stream():
+                yield slug
+        except SlugKitValidationError:
+            self._logger.debug(f"Server rejected range of {total} slug(s), falling back to batched stream")
+            async for slug in generator.stream():
+                yield slug
+
+    async def batches_concurrent(self, *, concurrency: int = 4) -> AsyncGenerator[list[str], Any]:
+        """Yield batches for a known limit using concurrent requests.
+
+        The limited range is split into batch-size chunks which are
+        fetched with up to *concurrency* POSTs in flight, overlapping
+        round-trip latency; batches are yielded in range order. Falls
+        back to the sequential stream when no limit is set. Keep
+        *concurrency* within the client's connection-pool bound.
+        """
+        limit = self._limit
+        if limit is None:
+            async for batch in self.mint_batches():
+                yield batch
+            return
 
-    async def stream(self) -> AsyncGenerator[str, Any]:
+        path = self._get_path()
+        client = self._http_client
+        sequence = self._sequence
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def fetch(offset: int, size: int) -> list[str]:
+            req = self._get_request(size, sequence + offset if self._dry_run else None)
+            async with semaphore:
+                response = await client.post(path, **json_request_args(req))
+                check_response(response, "mint_slugs", path)
+                return json_response(response)
+
+        tasks = []
+        offset = 0
+        while offset < limit:
+            size = min(self._batch_size, limit - offset)
+            tasks.append(asyncio.create_task(fetch(offset, size)))
+            offset += size
+        try:
+            for task in tasks:
+                yield await task
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _read_response_batches(self, response: httpx.Response) -> AsyncGenerator[list[str], Any]:
+        """Read a streaming response as fixed-size byte chunks and yield
+        decoded slug batches, splitting lines ourselves to avoid httpx's
+        per-line decoding overhead."""
+        buffer = bytearray()
+        async for chunk in response.aiter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+            lines, buffer = split_stream_lines(buffer, chunk)
+            slugs = decode_stream_lines(lines)
+            if slugs:
+                yield slugs
+        if buffer:
+            slugs = decode_stream_lines([bytes(buffer)])
+            if slugs:
+                yield slugs
+
+    async def mint_batches(self) -> AsyncGenerator[list[str], Any]:
+        """Yield decoded slugs one network chunk at a time.
+
+        This is the fast path for high-throughput consumers: it awaits
+        once per received chunk instead of once per slug, amortizing
+        event-loop scheduling across the whole chunk. When a limit is
+        known up front the whole session is served over one streaming
+        request; the per-batch loop is kept for the unbounded case and as
+        a fallback when the server rejects the full count.
+        """
         count = 0
         limit = self._limit
         batch_size = self._batch_size
         sequence = self._sequence
         path = self._get_path(stream=True)
-
+        client = self._http_client
+        logger = self._logger
+        # Hoist the level check out of the hot loop; per-batch logging is
+        # DEBUG-only noise at scale and the lazy %-style args avoid
+        # formatting when disabled.
+        log_debug = logger.isEnabledFor(logging.DEBUG)
+
+        if limit is not None and limit > batch_size:
+            req = self._get_request(limit, sequence)
+            if log_debug:
+                logger.debug("Requesting stream of %d slug(s)", limit)
+            try:
+                async with client.stream("POST", path, **json_request_args(req)) as response:
+                    response.raise_for_status()
+                    async for slugs in self._read_response_batches(response):
+                        if count + len(slugs) > limit:
+                            slugs = slugs[: limit - count]
+                        count += len(slugs)
+                        yield slugs
+                        if count >= limit:
+                            return
+                return
+            except httpx.HTTPStatusError as e:
+                error = handle_http_error(e, "stream_slugs", path)
+                if isinstance(error, SlugKitValidationError):
+                    # The server would not serve the whole count in one
+                    # request; fall back to the batched loop below.
+                    logger.debug(f"Server rejected stream of {limit} slug(s), falling back to batches")
+                    count = 0
+                elif should_retry_error(error):
+                    # Transient mid-stream failure; the batched loop
+                    # below resumes from what was already yielded.
+                    logger.debug(f"Stream failed after {count} slug(s), resuming in batches")
+                else:
+                    raise error
+            except KeyboardInterrupt:
+                return
+
+        attempts_left = 2
         try:
             while True:
                 if limit is not None and count >= limit:
@@ -60,39 +285,113 @@ class AsyncSlugGenerator(GeneratorBase):
                 if current_batch_size <= 0:
                     break
 
-                client = await self._http_client()
-                async with client:
-                    req = self._get_request(current_batch_size, sequence)
-                    self._logger.info(f"Requesting batch of {current_batch_size} slug(s)")
-                    # Get the streaming response and use it as a context manager
+                # Derive the sequence from what was actually yielded so
+                # a retried batch resumes without duplicates.
+                req = self._get_request(current_batch_size, sequence + count)
+                if log_debug:
+                    logger.debug("Requesting batch of %d slug(s)", current_batch_size)
+                try:
+                    # Get the streaming response and use it as a context
+                    # manager. Note: the context manager only closes the
+                    # response body, not the shared client.
                     stream_response = client.stream(
                         "POST",
                         path,
-                        json=req,
+                        **json_request_args(req),
                     )
                     async with stream_response as response:
                         response.raise_for_status()
-                        self._logger.debug(f"Received batch of {current_batch_size} slug(s)")
-                        # Get the async iterator and use it
-                        async_lines = response.aiter_lines()
-                        async for val in async_lines:
-                            yield val.strip()
-                            count += 1
+                        if log_debug:
+                            logger.debug("Received batch of %d slug(s)", current_batch_size)
+                        async for slugs in self._read_response_batches(response):
+                            if limit is not None and count + len(slugs) > limit:
+                                slugs = slugs[: limit - count]
+                            count += len(slugs)
+                            yield slugs
                             if limit is not None and count >= limit:
                                 return
-                sequence += current_batch_size
-        except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "stream_slugs", path)
+                except httpx.HTTPStatusError as e:
+                    error = handle_http_error(e, "stream_slugs", path)
+                    if attempts_left <= 0 or not should_retry_error(error):
+                        raise error
+                    attempts_left -= 1
+                    delay = calculate_backoff_delay(2 - attempts_left, 1.0, retry_after=getattr(error, "retry_after", None))
+                    logger.debug(f"Retrying batch after {delay:.1f}s: {error}")
+                    await asyncio.sleep(delay)
         except KeyboardInterrupt:
             return
 
-    def __aiter__(self) -> AsyncGenerator[str, None]:
+    async def collect(self, n: int) -> list[str]:
+        """Drain *n* slugs from the stream into a list.
+
+        Equivalent to ``[s async for s in gen.with_limit(n).stream()]``
+        but extends the result one network chunk at a time, so the event
+        loop is hit once per chunk rather than once per slug.
+        """
+        # The final size is known up front, so preallocate and fill by
+        # slice assignment instead of growing (and reallocating) the
+        # list chunk by chunk.
+        out: list[str] = [None] * n  # type: ignore[list-item]
+        filled = 0
+        async for batch in self.with_limit(n).mint_batches():
+            out[filled : filled + len(batch)] = batch
+            filled += len(batch)
+            if filled >= n:
+                break
+        if filled < n:
+            del out[filled:]
+        return out
+
+    async def prefetched_batches(self, depth: int = 2) -> AsyncGenerator[list[str], Any]:
+        """Yield mint_batches() output while prefetching ahead.
+
+        A producer task keeps up to *depth* decoded batches in a bounded
+        queue, so fetching batch N+1 overlaps with the consumer working
+        through batch N instead of leaving the network idle. The bound
+        provides back-pressure when the consumer is the slow side.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=depth)
+        done = object()
+
+        async def produce() -> None:
+            try:
+                async for batch in self.mint_batches():
+                    await queue.put(batch)
+            except asyncio.CancelledError:
+                raise
+            except BaseException as e:
+                await queue.put(e)
+                return
+            await queue.put(done)
+
+        task = asyncio.create_task(produce())
+        try:
+            while True:
+                item = await queue.get()
+                if item is done:
+                    break
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            if not task.done():
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+    def stream(self) -> AsyncIterator[str]:
+        return _SlugStreamIterator(self.prefetched_batches())
+
+    def __aiter__(self) -> AsyncIterator[str]:
         return self.stream()
 
 
 class AsyncRandomGenerator(GeneratorBase):
-    def __init__(self, http_client: Callable[[], httpx.AsyncClient]):
+    __slots__ = ("_metadata_cache",)
+
+    def __init__(self, http_client: httpx.AsyncClient, metadata_cache: _TTLCache | None = None):
         self._http_client = http_client
+        self._metadata_cache = metadata_cache if metadata_cache is not None else _TTLCache()
 
     async def __call__(
         self,
@@ -107,62 +406,92 @@ class AsyncRandomGenerator(GeneratorBase):
         }
         if seed:
             req["seed"] = seed
-        if sequence:
+        if sequence is not None:
             req["sequence"] = sequence
         if count:
             req["count"] = count
-        client = await self._http_client()
-        try:
-            response = await client.post(Endpoints.FORGE.value, json=req)
-            response.raise_for_status()
-            return response.json()
-        except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "forge_slugs", Endpoints.FORGE.value, pattern=pattern)
+        client = self._http_client
+        response = await client.post(_FORGE, **json_request_args(req))
+        check_response(response, "forge_slugs", _FORGE, pattern=pattern)
+        return json_response(response)
 
     async def pattern_info(self, pattern: str) -> PatternInfo:
-        client = await self._http_client()
+        cached = self._metadata_cache.get((_PATTERN_INFO, pattern))
+        if cached is not None:
+            return cached
+        client = self._http_client
         try:
-            response = await client.post(Endpoints.PATTERN_INFO.value, json={"pattern": pattern})
+            response = await client.post(_PATTERN_INFO, **json_request_args({"pattern": pattern}))
             response.raise_for_status()
-            data = response.json()
-            return PatternInfo.from_dict(data)
+            info = PatternInfo.model_validate_json(response.content)
+            self._metadata_cache.set((_PATTERN_INFO, pattern), info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "pattern_info", Endpoints.PATTERN_INFO.value, pattern=pattern)
+            raise handle_http_error(e, "pattern_info", _PATTERN_INFO, pattern=pattern)
 
     async def dictionary_info(self) -> list[DictionaryInfo]:
-        client = await self._http_client()
+        cached = self._metadata_cache.get(_DICTIONARY_INFO)
+        if cached is not None:
+            return cached
+        client = self._http_client
         try:
-            response = await client.get(Endpoints.DICTIONARY_INFO.value)
+            response = await client.get(_DICTIONARY_INFO)
             response.raise_for_status()
-            data = response.json()
-            return [DictionaryInfo.from_dict(item) for item in data]
+            info = DICTIONARY_INFO_LIST_ADAPTER.validate_json(response.content)
+            self._metadata_cache.set(_DICTIONARY_INFO, info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "dictionary_info", Endpoints.DICTIONARY_INFO.value)
+            raise handle_http_error(e, "dictionary_info", _DICTIONARY_INFO)
 
     async def dictionary_tags(self, kind: str, *, limit: int = 100, offset: int = 0) -> PaginatedTags:
-        client = await self._http_client()
+        client = self._http_client
         try:
-            response = await client.get(f"{Endpoints.DICTIONARY_TAGS.value}/{kind}?limit={limit}&offset={offset}")
+            response = await client.get(f"{_DICTIONARY_TAGS}/{kind}", params={"limit": limit, "offset": offset})
             response.raise_for_status()
-            data = response.json()
-            return PaginatedTags.from_dict(data)
+            return PaginatedTags.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "dictionary_tags", Endpoints.DICTIONARY_TAGS.value)
+            raise handle_http_error(e, "dictionary_tags", _DICTIONARY_TAGS)
+
+    async def fetch_metadata(
+        self,
+        pattern: str | None = None,
+        *,
+        tag_kind: str | None = None,
+    ) -> tuple[list[DictionaryInfo], PaginatedTags | None, PatternInfo | None]:
+        """Fetch dictionary info, tags and pattern info concurrently.
+
+        The requests run in one TaskGroup on the shared client, so they
+        overlap (and multiplex over a single connection under HTTP/2)
+        instead of paying serial round-trips. Tags require a dictionary
+        kind and pattern info a pattern; either is skipped when its
+        argument is None.
+        """
+        async with asyncio.TaskGroup() as tg:
+            info_task = tg.create_task(self.dictionary_info())
+            tags_task = tg.create_task(self.dictionary_tags(tag_kind)) if tag_kind else None
+            pattern_task = tg.create_task(self.pattern_info(pattern)) if pattern else None
+        return (
+            info_task.result(),
+            tags_task.result() if tags_task else None,
+            pattern_task.result() if pattern_task else None,
+        )
 
 
 class AsyncSeriesClient:
     def __init__(
         self,
-        http_client: Callable[[], httpx.AsyncClient],
+        http_client: httpx.AsyncClient,
         base_url: str,
         api_key: str,
         series_slug: str | None = None,
+        metadata_cache: _TTLCache | None = None,
     ):
         self._http_client = http_client
         self.base_url = base_url
         self._api_key = api_key
         self._series: str | None = series_slug
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._metadata_cache = metadata_cache if metadata_cache is not None else _TTLCache()
 
     def __getitem__(self, series_slug: str) -> AsyncSlugGenerator:
         return self.with_series(series_slug)
@@ -173,6 +502,7 @@ class AsyncSeriesClient:
             self.base_url,
             self._api_key,
             series_slug,
+            metadata_cache=self._metadata_cache,
         )
 
     @property
@@ -183,121 +513,166 @@ class AsyncSeriesClient:
     def slice(self) -> AsyncSlugGenerator:
         return AsyncSlugGenerator(self._http_client, series_slug=self._series).with_dry_run()
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def stats(self) -> list[StatsItem]:
         try:
-            client = await self._http_client()
+            client = self._http_client
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = await client.post(Endpoints.STATS.value, json=req)
+            response = await client.post(_STATS, **json_request_args(req))
             response.raise_for_status()
-            data = response.json()
-            return [StatsItem.from_dict(item) for item in data]
+            return STATS_LIST_ADAPTER.validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_stats", Endpoints.STATS.value)
+            raise handle_http_error(e, "series_stats", _STATS)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def info(self) -> SeriesInfo:
+        cached = self._metadata_cache.get((_SERIES_INFO, self._series))
+        if cached is not None:
+            return cached
         try:
-            client = await self._http_client()
+            client = self._http_client
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = await client.post(Endpoints.SERIES_INFO.value, json=req)
+            response = await client.post(_SERIES_INFO, **json_request_args(req))
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            info = SeriesInfo.model_validate_json(response.content)
+            self._metadata_cache.set((_SERIES_INFO, self._series), info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_info", Endpoints.SERIES_INFO.value)
+            raise handle_http_error(e, "series_info", _SERIES_INFO)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def list(self) -> dict[str, str]:
         try:
-            client = await self._http_client()
-            response = await client.get(Endpoints.SERIES_LIST.value)
+            client = self._http_client
+            response = await client.get(_SERIES_LIST)
             response.raise_for_status()
-            data = response.json()
+            data = json_response(response)
             return data
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_list", Endpoints.SERIES_LIST.value)
+            raise handle_http_error(e, "series_list", _SERIES_LIST)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def create(self, name: str, pattern: str) -> SeriesInfo:
         try:
-            client = await self._http_client()
-            response = await client.post(Endpoints.SERIES_CREATE.value, json={"name": name, "pattern": pattern})
+            client = self._http_client
+            response = await client.post(_SERIES_CREATE, json={"name": name, "pattern": pattern})
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            self._metadata_cache.invalidate()
+            return SeriesInfo.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_create", Endpoints.SERIES_CREATE.value)
+            raise handle_http_error(e, "series_create", _SERIES_CREATE)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def update(self, name: str, pattern: str) -> SeriesInfo:
         try:
-            client = await self._http_client()
+            client = self._http_client
             response = await client.put(
-                Endpoints.SERIES_UPDATE.value, json={"series": self._series, "name": name, "pattern": pattern}
+                _SERIES_UPDATE, json={"series": self._series, "name": name, "pattern": pattern}
             )
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            self._metadata_cache.invalidate()
+            return SeriesInfo.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_update", Endpoints.SERIES_UPDATE.value)
+            raise handle_http_error(e, "series_update", _SERIES_UPDATE)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def delete(self) -> None:
         try:
-            client = await self._http_client()
+            client = self._http_client
             response = await client.request(
                 "DELETE",
-                Endpoints.SERIES_DELETE.value,
+                _SERIES_DELETE,
                 json={"series": self._series},
             )
             response.raise_for_status()
+            self._metadata_cache.invalidate()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_delete", Endpoints.SERIES_DELETE.value)
+            raise handle_http_error(e, "series_delete", _SERIES_DELETE)
 
-    @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def reset(self) -> None:
         try:
-            client = await self._http_client()
+            client = self._http_client
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = await client.post(Endpoints.RESET.value, json=req)
+            response = await client.post(_RESET, **json_request_args(req))
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_reset", Endpoints.RESET.value)
+            raise handle_http_error(e, "series_reset", _RESET)
 
 
 class AsyncClient:
+    """Async SlugKit API client backed by one shared httpx client.
+
+    HTTP/2 is enabled by default so concurrent calls multiplex over a
+    single connection; httpx negotiates the protocol via ALPN and falls
+    back to HTTP/1.1 automatically if the server does not speak h2.
+    Pass ``http2=False`` to skip the negotiation entirely.
+    """
+
     def __init__(
         self,
         base_url: str,
         api_key: str | None = None,
         *,
         httpx_client_factory: Callable[[], Any] = httpx.AsyncClient,
-        timeout: float = 10.0,
+        timeout: float | httpx.Timeout = 10.0,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        limits: httpx.Limits | None = None,
     ):
-        if not base_url:
-            base_url = os.getenv("SLUGKIT_BASE_URL")
+        if not base_url or not api_key:
+            default_base_url, default_api_key = _default_config()
+            base_url = base_url or default_base_url
+            api_key = api_key or default_api_key
         if not base_url:
             raise ValueError("SLUGKIT_BASE_URL is not set")
-        if not api_key:
-            api_key = os.getenv("SLUGKIT_API_KEY", None)
         self.base_url = base_url
         self._api_key = api_key
         self._httpx_client_factory = httpx_client_factory
         self._timeout = timeout
-
-    async def _http_client(self) -> httpx.AsyncClient:
-        return self._httpx_client_factory(
-            base_url=self.base_url,
-            headers={"x-api-key": self._api_key},
-            timeout=self._timeout,
+        self._http2 = http2
+        # A full httpx.Limits overrides the individual pool parameters,
+        # for callers tuning bulk fan-out workloads.
+        self._limits = limits or httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
         )
+        self._client: httpx.AsyncClient | None = None
+        self._metadata_cache = _TTLCache()
+
+    def _http_client(self) -> httpx.AsyncClient:
+        """Return the shared httpx client, creating it on first use.
+
+        Reusing a single client keeps TLS sessions and keep-alive
+        connections alive across requests instead of paying a fresh
+        handshake per call. The pool is bounded so highly concurrent
+        callers (e.g. AsyncSlugGenerator.many with a large concurrency)
+        queue on existing connections instead of opening an unbounded
+        number of sockets.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._httpx_client_factory(
+                base_url=self.base_url,
+                headers={"x-api-key": self._api_key},
+                timeout=self._timeout,
+                http2=self._http2,
+                limits=self._limits,
+                transport=httpx.AsyncHTTPTransport(retries=3, http2=self._http2, limits=self._limits),
+            )
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the shared httpx client and its connection pool."""
+        if self._client is not None and not self._client.is_closed:
+            await self._client.aclose()
+
+    async def __aenter__(self) -> "AsyncClient":
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback) -> None:
+        await self.aclose()
 
     def _create_error_context(self, operation: str, endpoint: str = None, **kwargs) -> ErrorContext:
         """Create error context for better error reporting."""
@@ -306,24 +681,28 @@ class AsyncClient:
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def ping(self) -> None:
         try:
-            client = await self._http_client()
-            response = await client.get(Endpoints.PING.value)
+            client = self._http_client()
+            response = await client.get(_PING)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "ping", Endpoints.PING.value)
+            raise handle_http_error(e, "ping", _PING)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def key_info(self) -> KeyInfo:
         if not self._api_key:
             raise ValueError("API key is required")
+        cached = self._metadata_cache.get(_KEY_INFO)
+        if cached is not None:
+            return cached
         try:
-            client = await self._http_client()
-            response = await client.post(Endpoints.KEY_INFO.value)
+            client = self._http_client()
+            response = await client.post(_KEY_INFO)
             response.raise_for_status()
-            data = response.json()
-            return KeyInfo.from_dict(data)
+            info = KeyInfo.model_validate_json(response.content)
+            self._metadata_cache.set(_KEY_INFO, info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "key_info", Endpoints.KEY_INFO.value)
+            raise handle_http_error(e, "key_info", _KEY_INFO)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     async def limits(self) -> SubscriptionFeatures:
@@ -334,28 +713,41 @@ class AsyncClient:
         """
         if not self._api_key:
             raise ValueError("API key is required")
+        cached = self._metadata_cache.get(_LIMITS)
+        if cached is not None:
+            return cached
         try:
-            client = await self._http_client()
-            response = await client.get(Endpoints.LIMITS.value)
+            client = self._http_client()
+            response = await client.get(_LIMITS)
             response.raise_for_status()
-            data = response.json()
-            return SubscriptionFeatures.from_dict(data)
+            features = SubscriptionFeatures.model_validate_json(response.content)
+            self._metadata_cache.set(_LIMITS, features, cache_ttl_from_headers(response.headers))
+            return features
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "limits", Endpoints.LIMITS.value)
+            raise handle_http_error(e, "limits", _LIMITS)
 
     @property
     def api_key(self) -> str | None:
         """Get the API key."""
         return self._api_key
 
+    # These accessors rebuild the lightweight wrapper per access (the
+    # wrapped httpx client may be replaced after aclose()), but share the
+    # client-level _TTLCache so metadata stays cached across accesses and
+    # a create/update/delete invalidation reaches every later reader.
     @property
     def series(self) -> AsyncSeriesClient:
         if not self._api_key:
             raise ValueError("API key is required")
-        return AsyncSeriesClient(self._http_client, self.base_url, self._api_key)
+        return AsyncSeriesClient(
+            self._http_client(),
+            self.base_url,
+            self._api_key,
+            metadata_cache=self._metadata_cache,
+        )
 
     @property
     def forge(self) -> AsyncRandomGenerator:
         if not self._api_key:
             raise ValueError("API key is required")
-        return AsyncRandomGenerator(self._http_client)
+        return AsyncRandomGenerator(self._http_client(), metadata_cache=self._metadata_cache)
@@ -1,8 +1,15 @@
+import copy
 import httpx
 import logging
+import time
 from enum import Enum
-from typing import Any, Callable, Self
-from pydantic import BaseModel
+from typing import Any, Callable, ClassVar, Self
+from pydantic import BaseModel, ConfigDict, TypeAdapter
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
 from .errors import (
     SlugKitError,
     SlugKitConnectionError,
@@ -19,6 +26,8 @@ from .errors import (
     get_error_recovery_suggestions,
     categorize_error,
     handle_http_error,
+    should_retry_error,
+    calculate_backoff_delay,
     retry_with_backoff,
 )
 
@@ -34,324 +43,154 @@ class Endpoints(str, Enum):
     FORGE = "/gen/forge"
     RESET = "/gen/reset"
     STATS = "/gen/stats/latest"
-    SERIES_LIST = "/gen/series"
-    SERIES_CREATE = "/gen/series"
-    SERIES_UPDATE = "/gen/series"
-    SERIES_DELETE = "/gen/series"
+    SERIES = "/gen/series"
+    # Duplicate Enum values alias the first member; spell that out so
+    # only one SERIES member is constructed and the rest are plain
+    # aliases kept for call-site readability.
+    SERIES_LIST = SERIES
+    SERIES_CREATE = SERIES
+    SERIES_UPDATE = SERIES
+    SERIES_DELETE = SERIES
     SERIES_INFO = "/gen/series-info"
     PATTERN_INFO = "/gen/pattern-info"
     DICTIONARY_INFO = "/gen/dictionary-info"
     DICTIONARY_TAGS = "/gen/dictionary-tags"
 
 
-DEFAULT_BATCH_SIZE = 100000
+from ._constants import DEFAULT_BATCH_SIZE, DEFAULT_STREAM_CHUNK_SIZE  # noqa: E402 (re-export)
 
 
-def get_error_recovery_suggestions(error: Exception) -> list[str]:
+def json_request_args(req: dict[str, Any]) -> dict[str, Any]:
     """
-    Get recovery suggestions for different types of errors.
-
-    Args:
-        error: The exception that occurred
+    Build httpx request kwargs for a JSON body.
 
-    Returns:
-        List of human-readable recovery suggestions
+    Uses orjson to serialize straight to bytes when it is installed
+    (install the ``orjson`` extra), falling back to httpx's stdlib-based
+    ``json=`` path otherwise.
     """
-    suggestions = []
-
-    if isinstance(error, SlugKitConnectionError):
-        suggestions.extend(
-            [
-                "Check your internet connection",
-                "Verify the server URL is correct and accessible",
-                "Try again in a few moments (network issues are often temporary)",
-                "Check if there are any firewall or proxy restrictions",
-            ]
-        )
-
-    elif isinstance(error, SlugKitAuthenticationError):
-        suggestions.extend(
-            [
-                "Verify your API key is correct",
-                "Check if your API key has expired",
-                "Ensure your API key has the required permissions",
-                "Contact support if the issue persists",
-            ]
-        )
-
-    elif isinstance(error, SlugKitValidationError):
-        suggestions.extend(
-            [
-                "Review the pattern syntax in the SlugKit documentation",
-                "Check for balanced braces and valid placeholder names",
-                "Verify number generator syntax (e.g., {number:3d})",
-                "Use validate_pattern() to test your pattern before use",
-            ]
-        )
-
-    elif isinstance(error, SlugKitTimeoutError):
-        suggestions.extend(
-            [
-                "The operation may complete if you wait longer",
-                "Consider reducing the batch size for large operations",
-                "Check your network latency to the server",
-                "Try again during off-peak hours",
-            ]
-        )
-
-    elif isinstance(error, SlugKitRateLimitError):
-        suggestions.extend(
-            [
-                "Wait before making additional requests",
-                "Implement exponential backoff in your application",
-                "Consider upgrading your plan for higher rate limits",
-                "Batch multiple operations together when possible",
-            ]
-        )
-
-    elif isinstance(error, SlugKitQuotaError):
-        suggestions.extend(
-            [
-                "Check your current usage against your plan limits",
-                "Consider upgrading your plan for higher quotas",
-                "Review and optimize your slug generation patterns",
-                "Contact support to discuss quota increases",
-            ]
-        )
-
-    elif isinstance(error, SlugKitConfigurationError):
-        suggestions.extend(
-            [
-                "Verify your configuration settings",
-                "Check environment variables are set correctly",
-                "Review the configuration documentation",
-                "Ensure all required fields are provided",
-            ]
-        )
-
-    # Generic suggestions for any error
-    suggestions.extend(
-        [
-            "Check the SlugKit documentation for troubleshooting",
-            "Review the error context for additional details",
-            "Enable debug logging for more information",
-            "Contact support with the full error details if the issue persists",
-        ]
-    )
-
-    return suggestions
-
+    if orjson is not None:
+        return {"content": orjson.dumps(req), "headers": {"content-type": "application/json"}}
+    return {"json": req}
 
-class ErrorSeverity:
-    """Error severity levels for categorization."""
-
-    LOW = "low"
-    MEDIUM = "medium"
-    HIGH = "high"
-    CRITICAL = "critical"
-
-
-def categorize_error(error: Exception) -> dict:
-    """
-    Categorize an error with severity and type information.
 
-    Args:
-        error: The exception that occurred
+def check_response(response: httpx.Response, operation: str, endpoint: str, **kwargs: Any) -> None:
+    """Raise the mapped SlugKit error unless the response is a 2xx.
 
-    Returns:
-        Dictionary with error categorization
+    Cheaper than raise_for_status() on the success path: the status
+    check is a plain comparison and the exception machinery only runs
+    on failure. Non-2xx statuses that raise_for_status() would reject
+    (including 1xx/3xx) keep raising here, preserving its contract.
     """
-    if isinstance(error, SlugKitConnectionError):
-        return {"type": "connectivity", "severity": ErrorSeverity.MEDIUM, "retryable": True, "user_actionable": True}
+    if response.is_success:
+        return
+    try:
+        response.raise_for_status()
+    except httpx.HTTPStatusError as e:
+        raise handle_http_error(e, operation, endpoint, **kwargs)
 
-    elif isinstance(error, SlugKitAuthenticationError):
-        return {"type": "authentication", "severity": ErrorSeverity.HIGH, "retryable": False, "user_actionable": True}
 
-    elif isinstance(error, SlugKitValidationError):
-        return {"type": "validation", "severity": ErrorSeverity.LOW, "retryable": False, "user_actionable": True}
+def json_response(response: httpx.Response) -> Any:
+    """Decode a JSON response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
 
-    elif isinstance(error, SlugKitTimeoutError):
-        return {"type": "performance", "severity": ErrorSeverity.MEDIUM, "retryable": True, "user_actionable": True}
 
-    elif isinstance(error, SlugKitRateLimitError):
-        return {"type": "rate_limiting", "severity": ErrorSeverity.MEDIUM, "retryable": True, "user_actionable": True}
-
-    elif isinstance(error, SlugKitQuotaError):
-        return {"type": "quota", "severity": ErrorSeverity.HIGH, "retryable": False, "user_actionable": True}
-
-    elif isinstance(error, SlugKitConfigurationError):
-        return {"type": "configuration", "severity": ErrorSeverity.HIGH, "retryable": False, "user_actionable": True}
-
-    elif isinstance(error, SlugKitServerError):
-        return {"type": "server", "severity": ErrorSeverity.HIGH, "retryable": True, "user_actionable": False}
-
-    else:
-        return {"type": "unknown", "severity": ErrorSeverity.MEDIUM, "retryable": False, "user_actionable": False}
-
-
-def should_retry_error(error: Exception) -> bool:
+def split_stream_lines(buffer: bytearray, chunk: bytes) -> tuple[list[bytes], bytearray]:
     """
-    Determine if an error should trigger a retry.
+    Split complete newline-terminated lines out of a streamed chunk.
 
-    Args:
-        error: The exception that occurred
-
-    Returns:
-        True if the error is retryable, False otherwise
+    Appends *chunk* to *buffer* and returns the complete lines along with
+    the remaining partial line to carry over to the next chunk. Splitting
+    raw bytes on b"\\n" is considerably cheaper than a per-line decoder
+    for the short ASCII slugs the streaming endpoints produce.
     """
-    # Retry on connection errors, timeouts, and 5xx server errors
-    if isinstance(error, (httpx.ConnectError, httpx.TimeoutException)):
-        return True
-
-    # Retry on SlugKit connection errors
-    if isinstance(error, SlugKitConnectionError):
-        return True
-
-    # Retry on 5xx server errors (server issues)
-    if isinstance(error, httpx.HTTPStatusError):
-        return 500 <= error.response.status_code < 600
-
-    # Retry on rate limit errors (temporary)
-    if isinstance(error, SlugKitRateLimitError):
-        return True
-
-    return False
-
-
-def calculate_backoff_delay(
-    attempt: int,
-    base_delay: float = 1.0,
-    max_delay: float = 60.0,
-    retry_after: int | None = None
-) -> float:
+    if buffer:
+        buffer.extend(chunk)
+        data = buffer
+    else:
+        # Fast path: nothing carried over, so split the chunk directly
+        # without copying it into the bytearray first.
+        data = chunk
+    if b"\n" not in data:
+        return [], bytearray(data) if data is chunk else buffer
+    # bytes.split and the line scan both run in C; this is the portable
+    # equivalent of a memchr-based parser loop.
+    *lines, rest = data.split(b"\n")
+    return lines, bytearray(rest)
+
+
+def decode_stream_lines(lines: list[bytes]) -> list[str]:
     """
-    Calculate exponential backoff delay with jitter.
-
-    If retry_after is provided (from rate limit header), use that instead.
-
-    Args:
-        attempt: Current attempt number (1-based)
-        base_delay: Base delay in seconds (default: 1.0)
-        max_delay: Maximum delay in seconds (default: 60.0)
-        retry_after: Explicit retry delay from server (e.g., X-Slug-Retry-After header)
-
-    Returns:
-        Delay in seconds before next retry
+    Decode split stream lines into slugs.
+
+    Patterns may embed arbitrary literal text, so decode as UTF-8 (whose
+    decoder takes the same fast path for the common all-ASCII slug) and
+    only slice off an explicit trailing carriage return; a generic
+    str.strip() would allocate and rescan every slug for whitespace that
+    is never there. Empty lines (e.g. from a trailing newline) are
+    dropped.
     """
-    import random
+    slugs = []
+    for line in lines:
+        if line[-1:] == b"\r":
+            line = line[:-1]
+        if line:
+            slugs.append(line.decode("utf-8"))
+    return slugs
 
-    # If server explicitly tells us when to retry, respect that
-    if retry_after is not None and retry_after > 0:
-        return float(retry_after)
 
-    # Exponential backoff: base_delay * 2^(attempt-1)
-    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+DEFAULT_METADATA_TTL = 60.0
 
-    # Add jitter (±25% random variation)
-    jitter = random.uniform(0.75, 1.25)
-    delay = delay * jitter
 
-    return delay
-
-
-def retry_with_backoff(
-    max_attempts: int = 3,
-    base_delay: float = 1.0,
-    max_delay: float = 60.0,
-    retryable_errors: tuple[type[Exception], ...] | None = None,
-):
-    """
-    Decorator that adds retry logic with exponential backoff to functions.
-
-    Args:
-        max_attempts: Maximum number of retry attempts (default: 3)
-        base_delay: Base delay in seconds (default: 1.0)
-        max_delay: Maximum delay in seconds (default: 60.0)
-        retryable_errors: Custom tuple of retryable exception types
-                         (default: uses should_retry_error function)
-
-    Example:
-        @retry_with_backoff(max_attempts=5, base_delay=2.0)
-        def my_function():
-            # This function will be retried up to 5 times
-            pass
-    """
-
-    def decorator(func):
-        import functools
-        import asyncio
-
-        @functools.wraps(func)
-        def sync_wrapper(*args, **kwargs):
-            last_error = None
-
-            for attempt in range(1, max_attempts + 1):
+def cache_ttl_from_headers(headers: httpx.Headers, default: float = DEFAULT_METADATA_TTL) -> float:
+    """Derive a cache TTL from a Cache-Control max-age header, if any."""
+    cache_control = headers.get("cache-control")
+    if isinstance(cache_control, str):
+        for directive in cache_control.split(","):
+            directive = directive.strip()
+            if directive.startswith("max-age="):
                 try:
-                    return func(*args, **kwargs)
-                except Exception as e:
-                    last_error = e
-
-                    # Check if we should retry
-                    if retryable_errors:
-                        should_retry = isinstance(e, retryable_errors)
-                    else:
-                        should_retry = should_retry_error(e)
-
-                    if not should_retry or attempt == max_attempts:
-                        break
+                    return float(directive[8:])
+                except ValueError:
+                    break
+    return default
 
-                    # Extract retry_after from rate limit errors
-                    retry_after = None
-                    if isinstance(e, SlugKitRateLimitError) and hasattr(e, 'retry_after'):
-                        retry_after = e.retry_after
 
-                    # Calculate delay and wait
-                    delay = calculate_backoff_delay(attempt, base_delay, max_delay, retry_after)
-                    import time
-
-                    time.sleep(delay)
-
-            # Re-raise the last error
-            raise last_error
+class _TTLCache:
+    """
+    Small TTL cache for rarely-changing metadata responses
+    (key info, limits, series/pattern/dictionary info).
 
-        @functools.wraps(func)
-        async def async_wrapper(*args, **kwargs):
-            last_error = None
+    Entries expire after the configured TTL measured on the monotonic
+    clock; expired entries are dropped lazily on access.
+    """
 
-            for attempt in range(1, max_attempts + 1):
-                try:
-                    return await func(*args, **kwargs)
-                except Exception as e:
-                    last_error = e
-
-                    # Check if we should retry
-                    if retryable_errors:
-                        should_retry = isinstance(e, retryable_errors)
-                    else:
-                        should_retry = should_retry_error(e)
-
-                    if not should_retry or attempt == max_attempts:
-                        break
-
-                    # Extract retry_after from rate limit errors
-                    retry_after = None
-                    if isinstance(e, SlugKitRateLimitError) and hasattr(e, 'retry_after'):
-                        retry_after = e.retry_after
-
-                    # Calculate delay and wait
-                    delay = calculate_backoff_delay(attempt, base_delay, max_delay, retry_after)
-                    await asyncio.sleep(delay)
-
-            # Re-raise the last error
-            raise last_error
-
-        # Return the appropriate wrapper based on whether the function is async
-        if asyncio.iscoroutinefunction(func):
-            return async_wrapper
+    __slots__ = ("_ttl", "_entries")
+
+    def __init__(self, ttl: float = DEFAULT_METADATA_TTL):
+        self._ttl = ttl
+        self._entries: dict[Any, tuple[float, Any]] = {}
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expiry, value = entry
+        if time.monotonic() >= expiry:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: Any, value: Any, ttl: float | None = None) -> None:
+        self._entries[key] = (time.monotonic() + (self._ttl if ttl is None else ttl), value)
+
+    def invalidate(self, key: Any = None) -> None:
+        """Drop one entry, or everything when no key is given."""
+        if key is None:
+            self._entries.clear()
         else:
-            return sync_wrapper
-
-    return decorator
+            self._entries.pop(key, None)
 
 
 class EventType(Enum):
@@ -381,9 +220,16 @@ class KeyScope(Enum):
     SERIES = "series"
 
 
+# Response DTOs are read-only snapshots of server state; freezing them
+# lets pydantic skip the assignment machinery and makes them hashable.
+_DTO_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+
 class Pagination(BaseModel):
     """Pydantic model representing a pagination object from the API response."""
 
+    model_config = _DTO_CONFIG
+
     limit: int
     offset: int
     total: int
@@ -402,6 +248,8 @@ class Pagination(BaseModel):
 class KeyInfo(BaseModel):
     """Pydantic model representing a key information from the API response."""
 
+    model_config = _DTO_CONFIG
+
     type: str
     """
     The type of key, api-key or sdk-config
@@ -444,6 +292,8 @@ class KeyInfo(BaseModel):
 class StatsItem(BaseModel):
     """Pydantic model representing a single stats item from the API response."""
 
+    model_config = _DTO_CONFIG
+
     event_type: str
     date_part: str
     total_count: int
@@ -464,6 +314,8 @@ class StatsItem(BaseModel):
 class SeriesInfo(BaseModel):
     """Pydantic model representing series information from the API response."""
 
+    model_config = _DTO_CONFIG
+
     slug: str
     org_slug: str
     name: str
@@ -486,6 +338,8 @@ class SeriesInfo(BaseModel):
 class PatternInfo(BaseModel):
     """Pydantic model representing pattern information from the API response."""
 
+    model_config = _DTO_CONFIG
+
     pattern: str
     capacity: str
     max_slug_length: int
@@ -505,6 +359,8 @@ class PatternInfo(BaseModel):
 class DictionaryInfo(BaseModel):
     """Pydantic model representing dictionary information from the API response."""
 
+    model_config = _DTO_CONFIG
+
     kind: str
     count: int
 
@@ -521,6 +377,8 @@ class DictionaryInfo(BaseModel):
 class DictionaryTag(BaseModel):
     """Pydantic model representing a dictionary tag from the API response."""
 
+    model_config = _DTO_CONFIG
+
     kind: str
     tag: str
     description: str | None = None
@@ -540,6 +398,8 @@ class DictionaryTag(BaseModel):
 class PaginatedTags(BaseModel):
     """Pydantic model representing a paginated tags object from the API response."""
 
+    model_config = _DTO_CONFIG
+
     data: list[DictionaryTag]
     pagination: Pagination
 
@@ -559,6 +419,8 @@ class SubscriptionFeatures(BaseModel):
     All fields are optional - missing fields indicate the feature/limit is not available.
     """
 
+    model_config = _DTO_CONFIG
+
     custom_features: bool | None = None
     max_series: int | None = None
     req_per_minute: int | None = None
@@ -590,10 +452,41 @@ class SubscriptionFeatures(BaseModel):
         return self.model_dump()
 
 
+# Adapters for list-shaped responses. validate_json() decodes straight
+# from the response bytes into typed models in one pydantic-core pass,
+# skipping the intermediate list-of-dicts a response.json() +
+# from_dict() loop would allocate.
+STATS_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[StatsItem])
+DICTIONARY_INFO_LIST_ADAPTER: TypeAdapter = TypeAdapter(list[DictionaryInfo])
+
+
 class GeneratorBase:
+    # Builder chains create several short-lived instances per user call;
+    # a fixed slot layout keeps them dict-free and attribute loads fast.
+    __slots__ = (
+        "_http_client",
+        "_series_slug",
+        "_batch_size",
+        "_limit",
+        "_dry_run",
+        "_sequence",
+        "_path",
+        "_stream_path",
+        "_req_template",
+        "_get_request",
+    )
+
+    # One logger per class, resolved when the class is defined, so
+    # instance construction skips logging.getLogger's lock and lookup.
+    _logger: ClassVar[logging.Logger]
+
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+        cls._logger = logging.getLogger(cls.__name__)
+
     def __init__(
         self,
-        http_client: Callable[[], httpx.Client],
+        http_client: Callable[[], httpx.Client] | httpx.AsyncClient,
         *,
         series_slug: str | None = None,
         batch_size: int = DEFAULT_BATCH_SIZE,
@@ -602,75 +495,83 @@ class GeneratorBase:
         sequence: int = 0,
     ):
         self._http_client = http_client
-        self._logger = logging.getLogger(f"{self.__class__.__name__}")
         self._series_slug = series_slug
         self._batch_size = batch_size
         self._limit = limit
         self._dry_run = dry_run
         self._sequence = sequence
+        # Derived state is immutable per instance, so precompute it here
+        # instead of re-deriving it on every request.
+        self._path = Endpoints.SLICE.value if dry_run else Endpoints.MINT.value
+        self._stream_path = f"{self._path}/stream"
+        self._req_template: dict[str, Any] = {}
+        if series_slug:
+            self._req_template["series"] = series_slug
+        self._select_get_request()
+
+    # The fluent with_* builders return shallow copies with one field
+    # overridden rather than re-running __init__ (logger lookup, path and
+    # template setup) on every link of a configuration chain. _clone is
+    # the single code path; derived state is recomputed only where the
+    # override invalidates it.
+
+    def _clone(self, **overrides: Any) -> Self:
+        new = copy.copy(self)
+        for attr, value in overrides.items():
+            setattr(new, attr, value)
+        if "_series_slug" in overrides:
+            new._req_template = {"series": new._series_slug} if new._series_slug else {}
+        if "_dry_run" in overrides:
+            new._path = Endpoints.SLICE.value if new._dry_run else Endpoints.MINT.value
+            new._stream_path = f"{new._path}/stream"
+        if "_series_slug" in overrides or "_dry_run" in overrides:
+            new._select_get_request()
+        return new
 
     def with_series(self, series_slug: str) -> Self:
-        return self.__class__(
-            self._http_client,
-            series_slug=series_slug,
-            batch_size=self._batch_size,
-            limit=self._limit,
-            dry_run=self._dry_run,
-            sequence=self._sequence,
-        )
+        return self._clone(_series_slug=series_slug)
 
     def with_batch_size(self, batch_size: int) -> Self:
-        return self.__class__(
-            self._http_client,
-            series_slug=self._series_slug,
-            batch_size=batch_size,
-            limit=self._limit,
-            dry_run=self._dry_run,
-            sequence=self._sequence,
-        )
+        return self._clone(_batch_size=batch_size)
 
     def with_limit(self, limit: int) -> Self:
-        return self.__class__(
-            self._http_client,
-            series_slug=self._series_slug,
-            batch_size=self._batch_size,
-            limit=limit,
-            dry_run=self._dry_run,
-            sequence=self._sequence,
-        )
+        return self._clone(_limit=limit)
 
     def with_dry_run(self) -> Self:
-        return self.__class__(
-            self._http_client,
-            series_slug=self._series_slug,
-            batch_size=self._batch_size,
-            limit=self._limit,
-            dry_run=True,
-            sequence=self._sequence,
-        )
+        return self._clone(_dry_run=True)
 
     def starting_from(self, sequence: int) -> Self:
-        return self.__class__(
-            self._http_client,
-            series_slug=self._series_slug,
-            batch_size=self._batch_size,
-            limit=self._limit,
-            dry_run=self._dry_run,
-            sequence=sequence,
-        )
-
-    def _get_request(self, count: int, sequence: int | None = None) -> dict[str, Any]:
-        req = {"count": count}
-        if self._dry_run and sequence is not None:
-            req["sequence"] = sequence
-        if self._series_slug:
-            req["series"] = self._series_slug
-        return req
+        return self._clone(_sequence=sequence)
+
+    def _select_get_request(self) -> None:
+        """
+        Bind a _get_request closure specialized for the current
+        configuration.
+
+        The template and dry_run flag are captured as closure cells, so
+        the per-request path loads no instance attributes and carries no
+        dry-run branch. Builders that invalidate either input
+        (with_series, with_dry_run) rebind the closure.
+        """
+        template = self._req_template
 
-    def _get_path(self, stream: bool = False) -> str:
-        path = Endpoints.MINT.value
         if self._dry_run:
-            path = Endpoints.SLICE.value
-        if stream:
-            path = f"{path}/stream"
-        return path
+
+            def _get_request(count: int, sequence: int | None = None) -> dict[str, Any]:
+                if sequence is not None:
+                    return {**template, "count": count, "sequence": sequence}
+                return {**template, "count": count}
+
+        else:
+
+            def _get_request(count: int, sequence: int | None = None) -> dict[str, Any]:
+                return {**template, "count": count}
+
+        self._get_request = _get_request
+
+    def _get_path(self, stream: bool = False) -> str:
+        return self._stream_path if stream else self._path
+
+
+# __init_subclass__ only fires for subclasses; bind the base logger here.
+GeneratorBase._logger = logging.getLogger("GeneratorBase")
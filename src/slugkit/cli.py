@@ -1,28 +1,40 @@
+from __future__ import annotations
+
+import atexit
+import functools
+import os
+import itertools
+import queue
+import sys
+import threading
 import time
 import typer
-import dotenv
-import httpx
 import json
 import logging
-import uuid
 
 from enum import Enum
+from typing import TYPE_CHECKING
 
-from slugkit import SyncClient
-from slugkit.sync_client import RandomGenerator
-from slugkit.base import StatsItem, SeriesInfo, SubscriptionFeatures, DEFAULT_BATCH_SIZE
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+from slugkit._constants import DEFAULT_BATCH_SIZE
 from slugkit.package_data import list_package_files, get_package_data
-from slugkit.errors import SlugKitError
 
-logging.basicConfig(level=logging.INFO)
+if TYPE_CHECKING:
+    from slugkit import SyncClient
+    from slugkit.base import SeriesInfo
+
 logger = logging.getLogger(__name__)
-logging.getLogger("httpx").setLevel(logging.ERROR)
 
 app = typer.Typer()
 
 
 class OutputFormat(str, Enum):
     JSON = "json"
+    NDJSON = "ndjson"
     TEXT = "text"
 
 
@@ -30,6 +42,7 @@ class AppContext:
     base_url: str
     api_key: str
     output_format: OutputFormat = OutputFormat.TEXT
+    _client: SyncClient | None = None
 
     allow_extra_args: bool = False
     allow_interspersed_args: bool = False
@@ -40,21 +53,273 @@ class AppContext:
         self.base_url = base_url
         self.api_key = api_key
         self.output_format = output_format
+        self._client = None
 
 
 app_context = typer.Context(AppContext)
+app_context._client = None
+
+
+def get_client() -> SyncClient:
+    """Return the shared SyncClient, creating it on first use.
+
+    All commands go through this so batched requests reuse the same
+    httpx connection pool instead of opening a new one per command.
+    """
+    if app_context._client is None:
+        import httpx
+
+        from slugkit import SyncClient
+
+        # Batched mint/slice runs hammer a single host; raise the pool
+        # limits so keep-alive sockets survive the whole run. Explicit
+        # per-phase timeouts keep a stuck server from hanging the CLI
+        # while leaving room for slow large-batch reads.
+        app_context._client = SyncClient(
+            app_context.base_url,
+            app_context.api_key,
+            timeout=httpx.Timeout(connect=3.0, read=30.0, write=10.0, pool=5.0),
+            max_connections=1000,
+            max_keepalive_connections=100,
+            keepalive_expiry=30.0,
+        )
+    return app_context._client
+
+
+def _close_client() -> None:
+    if app_context._client is not None:
+        app_context._client.close()
+
+
+_PREFETCH_DONE = object()
+
+
+def prefetch_iter(iterable, depth: int = 2, chunk_size: int = 1024):
+    """Iterate *iterable* on a background thread, keeping chunks ready.
+
+    While the main thread prints one chunk the producer thread is already
+    fetching the next batch, so network latency and stdout time overlap
+    instead of adding up.
+    """
+    ready: queue.Queue = queue.Queue(maxsize=depth)
+
+    def _producer():
+        try:
+            it = iter(iterable)
+            while chunk := list(itertools.islice(it, chunk_size)):
+                ready.put(chunk)
+        except BaseException as e:  # re-raised on the consumer side
+            ready.put(e)
+        else:
+            ready.put(_PREFETCH_DONE)
+
+    worker = threading.Thread(target=_producer, daemon=True)
+    worker.start()
+    while True:
+        item = ready.get()
+        if item is _PREFETCH_DONE:
+            return
+        if isinstance(item, BaseException):
+            raise item
+        yield from item
+
+
+def _parallel_slice_iter(slice_gen, sequence: int, count: int, batch_size: int, workers: int):
+    """Fetch independent slice batches concurrently, yielding slugs in order.
+
+    slice batches do not bump the series counter, so requests for
+    different offsets are independent; executor.map preserves submission
+    order while up to *workers* requests are in flight.
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    def fetch(offset: int) -> list[str]:
+        return slice_gen.starting_from(offset)(min(batch_size, sequence + count - offset))
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        for batch in pool.map(fetch, range(sequence, sequence + count, batch_size)):
+            yield from batch
+
+
+def handle_slugkit_errors(message: str):
+    """Log *message* and exit non-zero when a command's API call fails.
+
+    One shared wrapper replaces the per-command try/except boilerplate,
+    keeping each command body a straight-line fast path.
+    """
+
+    def decorator(fn):
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            from slugkit.errors import SlugKitError
+
+            try:
+                return fn(*args, **kwargs)
+            except SlugKitError as e:
+                logger.error(f"{message}: {e}")
+                raise typer.Exit(1)
+
+        return wrapper
+
+    return decorator
+
+
+@functools.lru_cache(maxsize=256)
+def _pattern_info_cached(pattern: str):
+    """Fetch pattern info once per pattern within a process.
+
+    pattern_info and validate hit the same endpoint for identical input;
+    repeat lookups (editor plugins, batch validation) stay local. The key
+    is the pattern alone because the process has a single shared client.
+    """
+    return get_client().forge.pattern_info(pattern)
+
+
+@handle_slugkit_errors("Failed to get pattern info")
+def _render_pattern_info(pattern: str) -> None:
+    """Shared body for the pattern_info and validate commands."""
+    pattern_info = _pattern_info_cached(pattern)
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(pattern_info)
+    else:
+        sys.stdout.write(_PATTERN_INFO_TMPL.format_map(vars(pattern_info)))
+
+
+def _json_default(obj):
+    """Serialize DTO models through their to_dict() compat protocol."""
+    to_dict = getattr(obj, "to_dict", None)
+    if to_dict is not None:
+        return to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+if orjson is not None:
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE, default=_json_default)
+
+else:
+
+    def _dumps(obj) -> bytes:
+        return (json.dumps(obj, indent=2, default=_json_default) + "\n").encode()
+
+
+def _print_json(obj) -> None:
+    """Serialize *obj* with the fastest available encoder and write bytes.
+
+    orjson is several times faster than the stdlib json module on large
+    stats/series payloads and skips the extra encode inside print();
+    models are handled directly via the to_dict() default hook.
+    """
+    data = _dumps(obj)
+    out = getattr(sys.stdout, "buffer", None)
+    if out is None:  # plain text stream, e.g. under test capture
+        sys.stdout.write(data.decode())
+        return
+    sys.stdout.flush()
+    out.write(data)
+    out.flush()
+
+
+def _print_lines(slugs) -> None:
+    """Write slugs one per line, flushing in chunks.
+
+    A per-slug print() pays the stdout lock (and a TTY flush) for every
+    line; joining ~1024 lines per write amortizes that away. Writing
+    pre-encoded bytes to the underlying buffer also skips the
+    TextIOWrapper codec pass, which is pure overhead for slug output.
+    """
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    it = iter(slugs)
+    if out is None:  # plain text stream, e.g. under test capture
+        while chunk := list(itertools.islice(it, 1024)):
+            sys.stdout.write("\n".join(map(str, chunk)))
+            sys.stdout.write("\n")
+        sys.stdout.flush()
+        return
+    while chunk := list(itertools.islice(it, 1024)):
+        out.write(b"\n".join(str(s).encode() for s in chunk))
+        out.write(b"\n")
+    out.flush()
+
+
+def _print_ndjson(slugs) -> None:
+    """Write slugs as JSON Lines: one JSON document per line, no array.
+
+    Consumers (jq -c, log shippers) can process each line as it arrives
+    instead of buffering a monolithic array.
+    """
+    sys.stdout.flush()
+    out = getattr(sys.stdout, "buffer", None)
+    it = iter(slugs)
+    if out is None:  # plain text stream, e.g. under test capture
+        for slug in it:
+            sys.stdout.write(json.dumps(slug) + "\n")
+        sys.stdout.flush()
+        return
+    while chunk := list(itertools.islice(it, 1024)):
+        out.write(b"".join(json.dumps(s).encode() + b"\n" for s in chunk))
+    out.flush()
+
+
+def _print_json_stream(slugs) -> None:
+    """Write slugs as a JSON array one element at a time.
+
+    Keeps memory at O(batch_size) for large mint/slice runs and lets the
+    consumer see output as soon as the first batch arrives.
+    """
+    out = sys.stdout
+    out.write("[")
+    first = True
+    for slug in slugs:
+        out.write("\n  " if first else ",\n  ")
+        out.write(json.dumps(slug))
+        first = False
+    out.write("\n]\n" if not first else "]\n")
+
+
+# Pre-built record templates: one stdout write per record instead of one
+# print (and one runtime width computation) per field.
+_KEY_INFO_TMPL = (
+    "Type                     : {type}\n"
+    "Key Scope                : {key_scope}\n"
+    "Slug                     : {slug}\n"
+    "Org Slug                 : {org_slug}\n"
+    "Series Slug              : {series_slug}\n"
+    "Scopes                   : {scopes}\n"
+    "Enabled                  : {enabled}\n"
+)
+_PATTERN_INFO_TMPL = (
+    "Pattern                  : {pattern}\n"
+    "Capacity                 : {capacity}\n"
+    "Max Slug Length          : {max_slug_length}\n"
+    "Complexity               : {complexity}\n"
+    "Components               : {components}\n"
+)
+_STATS_TMPL = (
+    "Event Type               : {event_type}\n"
+    "Date Part                : {date_part}\n"
+    "Total Count              : {total_count}\n"
+    "Request Count            : {request_count}\n"
+    "Total Duration (μs)      : {total_duration_us}\n"
+    "Avg Duration (μs)        : {avg_duration_us}\n"
+    "--------------------------------------------------\n"
+)
+_SERIES_INFO_TMPL = (
+    "Series Slug              : {slug}\n"
+    "Organization Slug        : {org_slug}\n"
+    "Name                     : {name}\n"
+    "Pattern                  : {pattern}\n"
+    "Max Slug Length          : {max_slug_length}\n"
+    "Capacity                 : {capacity}\n"
+    "Generated Count          : {generated_count}\n"
+    "Last Modified            : {mtime}\n"
+)
 
 
 def print_series_info(series_info: SeriesInfo):
-    caption_width = 25
-    print(f"{'Series Slug':<{caption_width}}: {series_info.slug}")
-    print(f"{'Organization Slug':<{caption_width}}: {series_info.org_slug}")
-    print(f"{'Name':<{caption_width}}: {series_info.name}")
-    print(f"{'Pattern':<{caption_width}}: {series_info.pattern}")
-    print(f"{'Max Slug Length':<{caption_width}}: {series_info.max_slug_length}")
-    print(f"{'Capacity':<{caption_width}}: {series_info.capacity}")
-    print(f"{'Generated Count':<{caption_width}}: {series_info.generated_count}")
-    print(f"{'Last Modified':<{caption_width}}: {series_info.mtime}")
+    sys.stdout.write(_SERIES_INFO_TMPL.format_map(vars(series_info)))
 
 
 @app.callback()
@@ -86,98 +351,113 @@ def callback(
 
 
 @app.command()
+@handle_slugkit_errors("Failed to ping")
 def ping():
     """
     Ping the SlugKit API.
     """
-    try:
-        client = SyncClient(app_context.base_url, app_context.api_key)
-        start_time = time.time()
+    client = get_client()
+    if logger.isEnabledFor(logging.INFO):
+        start = time.perf_counter_ns()
+        client.ping()
+        logger.info("Ping successful in %.3f ms", (time.perf_counter_ns() - start) / 1e6)
+    else:
         client.ping()
-        end_time = time.time()
-        logger.info(f"Ping successful in {end_time - start_time:.2f} seconds")
-    except SlugKitError as e:
-        logger.error(f"Failed to ping: {e}")
-        raise typer.Exit(1)
 
 
 @app.command()
+@handle_slugkit_errors("Failed to get key info")
 def key_info():
     """
     Get information about the current key.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        key_info = client.key_info()
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(key_info.to_dict(), indent=2))
-        else:
-            caption_width = 25
-            print(f"{'Type':<{caption_width}}: {key_info.type}")
-            print(f"{'Key Scope':<{caption_width}}: {key_info.key_scope.value}")
-            print(f"{'Slug':<{caption_width}}: {key_info.slug}")
-            print(f"{'Org Slug':<{caption_width}}: {key_info.org_slug}")
-            print(f"{'Series Slug':<{caption_width}}: {key_info.series_slug}")
-            print(f"{'Scopes':<{caption_width}}: {key_info.scopes}")
-            print(f"{'Enabled':<{caption_width}}: {key_info.enabled}")
-    except SlugKitError as e:
-        logger.error(f"Failed to get key info: {e.response.text}")
-        raise typer.Exit(1)
+    client = get_client()
+    key_info = client.key_info()
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(key_info)
+    else:
+        fields = {**vars(key_info), "key_scope": key_info.key_scope.value}
+        sys.stdout.write(_KEY_INFO_TMPL.format_map(fields))
 
 
 @app.command()
+@handle_slugkit_errors("Failed to get limits")
 def limits():
     """
     Get subscription limits and features for the organisation.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        limits = client.limits()
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(limits.to_dict(), indent=2))
-        else:
-            caption_width = 30
-
-            def fmt(value):
-                """Format value, showing 'N/A' for None."""
-                return value if value is not None else 'N/A'
-
-            print("=== Series Limits ===")
-            print(f"{'Max Series':<{caption_width}}: {fmt(limits.max_series)}")
-            print()
-            print("=== Rate Limits ===")
-            print(f"{'Requests Per Minute':<{caption_width}}: {fmt(limits.req_per_minute)}")
-            print(f"{'Burst Requests Per Minute':<{caption_width}}: {fmt(limits.burst_req_per_minute)}")
-            print()
-            print("=== Forge Limits ===")
-            print(f"{'Forge Enabled':<{caption_width}}: {fmt(limits.forge_enabled)}")
-            print(f"{'Max Forge Per Day':<{caption_width}}: {fmt(limits.max_forge_per_day)}")
-            print(f"{'Max Forge Per Month':<{caption_width}}: {fmt(limits.max_forge_per_month)}")
-            print(f"{'Max Forge Per Request':<{caption_width}}: {fmt(limits.max_forge_per_request)}")
-            print()
-            print("=== Mint Limits ===")
-            print(f"{'Mint Enabled':<{caption_width}}: {fmt(limits.mint_enabled)}")
-            print(f"{'Max Mint Per Day':<{caption_width}}: {fmt(limits.max_mint_per_day)}")
-            print(f"{'Max Mint Per Month':<{caption_width}}: {fmt(limits.max_mint_per_month)}")
-            print(f"{'Max Mint Per Request':<{caption_width}}: {fmt(limits.max_mint_per_request)}")
-            print()
-            print("=== Slice Limits ===")
-            print(f"{'Slice Enabled':<{caption_width}}: {fmt(limits.slice_enabled)}")
-            print(f"{'Slice Window Back':<{caption_width}}: {fmt(limits.slice_window_back)}")
-            print(f"{'Slice Window Forward':<{caption_width}}: {fmt(limits.slice_window_forward)}")
-            print()
-            print("=== Access Control ===")
-            print(f"{'API Key Access':<{caption_width}}: {fmt(limits.api_key_access)}")
-            print(f"{'API Key Scopes':<{caption_width}}: {', '.join(limits.api_key_scopes) if limits.api_key_scopes else 'N/A'}")
-            print(f"{'SDK Access':<{caption_width}}: {fmt(limits.sdk_access)}")
-            print(f"{'SDK Scopes':<{caption_width}}: {', '.join(limits.sdk_scopes) if limits.sdk_scopes else 'N/A'}")
-            print()
-            print("=== Other ===")
-            print(f"{'Max Nodes':<{caption_width}}: {fmt(limits.max_nodes)}")
-            print(f"{'Custom Features':<{caption_width}}: {fmt(limits.custom_features)}")
-    except SlugKitError as e:
-        logger.error(f"Failed to get limits: {e}")
-        raise typer.Exit(1)
+    client = get_client()
+    limits = client.limits()
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(limits)
+    else:
+        def fmt(value):
+            """Format value, showing 'N/A' for None."""
+            return value if value is not None else "N/A"
+
+        def scopes(values):
+            return ", ".join(values) if values else "N/A"
+
+        sections = [
+            ("Series Limits", [("Max Series", fmt(limits.max_series))]),
+            (
+                "Rate Limits",
+                [
+                    ("Requests Per Minute", fmt(limits.req_per_minute)),
+                    ("Burst Requests Per Minute", fmt(limits.burst_req_per_minute)),
+                ],
+            ),
+            (
+                "Forge Limits",
+                [
+                    ("Forge Enabled", fmt(limits.forge_enabled)),
+                    ("Max Forge Per Day", fmt(limits.max_forge_per_day)),
+                    ("Max Forge Per Month", fmt(limits.max_forge_per_month)),
+                    ("Max Forge Per Request", fmt(limits.max_forge_per_request)),
+                ],
+            ),
+            (
+                "Mint Limits",
+                [
+                    ("Mint Enabled", fmt(limits.mint_enabled)),
+                    ("Max Mint Per Day", fmt(limits.max_mint_per_day)),
+                    ("Max Mint Per Month", fmt(limits.max_mint_per_month)),
+                    ("Max Mint Per Request", fmt(limits.max_mint_per_request)),
+                ],
+            ),
+            (
+                "Slice Limits",
+                [
+                    ("Slice Enabled", fmt(limits.slice_enabled)),
+                    ("Slice Window Back", fmt(limits.slice_window_back)),
+                    ("Slice Window Forward", fmt(limits.slice_window_forward)),
+                ],
+            ),
+            (
+                "Access Control",
+                [
+                    ("API Key Access", fmt(limits.api_key_access)),
+                    ("API Key Scopes", scopes(limits.api_key_scopes)),
+                    ("SDK Access", fmt(limits.sdk_access)),
+                    ("SDK Scopes", scopes(limits.sdk_scopes)),
+                ],
+            ),
+            (
+                "Other",
+                [
+                    ("Max Nodes", fmt(limits.max_nodes)),
+                    ("Custom Features", fmt(limits.custom_features)),
+                ],
+            ),
+        ]
+        # Assemble the whole report and write it once instead of ~35 prints.
+        buf = []
+        for title, rows in sections:
+            buf.append(f"=== {title} ===\n")
+            buf.extend(f"{caption:<30}: {value}\n" for caption, value in rows)
+            buf.append("\n")
+        buf.pop()  # no blank line after the last section
+        sys.stdout.write("".join(buf))
 
 
 @app.command()
@@ -187,24 +467,11 @@ def pattern_info(
     """
     Get information about a pattern.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        pattern_info = client.forge.pattern_info(pattern)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(pattern_info.to_dict(), indent=2))
-        else:
-            caption_width = 25
-            print(f"{'Pattern':<{caption_width}}: {pattern_info.pattern}")
-            print(f"{'Capacity':<{caption_width}}: {pattern_info.capacity}")
-            print(f"{'Max Slug Length':<{caption_width}}: {pattern_info.max_slug_length}")
-            print(f"{'Complexity':<{caption_width}}: {pattern_info.complexity}")
-            print(f"{'Components':<{caption_width}}: {pattern_info.components}")
-    except SlugKitError as e:
-        logger.error(f"Failed to get pattern info: {e}")
-        raise typer.Exit(1)
+    _render_pattern_info(pattern)
 
 
 @app.command()
+@handle_slugkit_errors("Failed to test pattern")
 def forge(
     pattern: str = typer.Argument(..., help="The slug pattern to test."),
     *,
@@ -217,19 +484,12 @@ def forge(
     """
     Get a list of slugs for a given pattern.
     """
-    if seed is None:
-        seed = str(uuid.uuid4())
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        result = client.forge(pattern, seed=seed, sequence=sequence, count=count)
-    except SlugKitError as e:
-        logger.error(f"Failed to test pattern: {e}")
-        raise typer.Exit(1)
-    if app_context.output_format == OutputFormat.JSON:
-        print(json.dumps(result, indent=2))
+    client = get_client()
+    result = client.forge(pattern, seed=seed, sequence=sequence, count=count)
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(result)
     else:
-        for slug in result:
-            print(slug)
+        _print_lines(result)
 
 
 @app.command()
@@ -249,7 +509,7 @@ def mint(
     Default output format is text.
     """
     logger.info(f"Generating {count} human-readable IDs at {app_context.base_url}")
-    client = SyncClient(app_context.base_url, app_context.api_key)
+    client = get_client()
     if series:
         client = client.series[series]
     else:
@@ -257,14 +517,17 @@ def mint(
     gen = client.mint
     if count > 1:
         gen = gen.with_limit(count).with_batch_size(batch_size)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(list(gen), indent=2))
+        if app_context.output_format is OutputFormat.JSON:
+            _print_json_stream(prefetch_iter(gen))
+        elif app_context.output_format is OutputFormat.NDJSON:
+            _print_ndjson(prefetch_iter(gen))
         else:
-            for slug in gen:
-                print(slug)
+            _print_lines(prefetch_iter(gen))
     elif count == 1:
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(gen(), indent=2))
+        if app_context.output_format is OutputFormat.JSON:
+            _print_json(gen())
+        elif app_context.output_format is OutputFormat.NDJSON:
+            _print_ndjson(gen())
         else:
             print(gen()[0])
     else:
@@ -277,27 +540,34 @@ def slice(
     count: int = typer.Argument(1, help="The number of slugs to generate."),
     batch_size: int = typer.Option(DEFAULT_BATCH_SIZE, "--batch-size", "-b", help="Size of a batch to fetch at once."),
     series: str | None = typer.Option(None, "--series", "-s", help="The series to use for the slugs."),
+    parallelism: int = typer.Option(1, "--parallelism", "-p", help="Number of batch requests to keep in flight."),
 ):
     """
     Generate slugs starting from a given sequence number.
     Series counters are not bumped.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
+    client = get_client()
     if series:
         client = client.series[series]
     else:
         client = client.series
     gen = client.slice.starting_from(sequence)
     if count > 1:
-        gen = gen.with_limit(count).with_batch_size(batch_size)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(list(gen), indent=2))
+        if parallelism > 1:
+            slugs = _parallel_slice_iter(client.slice, sequence, count, batch_size, parallelism)
         else:
-            for slug in gen:
-                print(slug)
+            slugs = prefetch_iter(gen.with_limit(count).with_batch_size(batch_size))
+        if app_context.output_format is OutputFormat.JSON:
+            _print_json_stream(slugs)
+        elif app_context.output_format is OutputFormat.NDJSON:
+            _print_ndjson(slugs)
+        else:
+            _print_lines(slugs)
     elif count == 1:
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(gen(), indent=2))
+        if app_context.output_format is OutputFormat.JSON:
+            _print_json(gen())
+        elif app_context.output_format is OutputFormat.NDJSON:
+            _print_ndjson(gen())
         else:
             print(gen()[0])
     else:
@@ -305,90 +575,71 @@ def slice(
 
 
 @app.command()
+@handle_slugkit_errors("Failed to get stats")
 def stats(
     series: str | None = typer.Option(None, "--series", "-s", help="The series to use for the stats."),
 ):
     """
     Get the stats of the generator.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
+    client = get_client()
     if series:
         client = client.series[series]
     else:
         client = client.series
-    try:
-        stats_items = client.stats()
-        if app_context.output_format == OutputFormat.JSON:
-            # Convert StatsItem objects to dictionaries for JSON serialization
-            stats_dicts = [item.to_dict() for item in stats_items]
-            print(json.dumps(stats_dicts, indent=2))
-        else:
-            caption_width = 25
-            for item in stats_items:
-                print(f"{'Event Type':<{caption_width}}: {item.event_type}")
-                print(f"{'Date Part':<{caption_width}}: {item.date_part}")
-                print(f"{'Total Count':<{caption_width}}: {item.total_count}")
-                print(f"{'Request Count':<{caption_width}}: {item.request_count}")
-                print(f"{'Total Duration (μs)':<{caption_width}}: {item.total_duration_us}")
-                print(f"{'Avg Duration (μs)':<{caption_width}}: {item.avg_duration_us}")
-                print("-" * 50)
-    except SlugKitError as e:
-        logger.error(f"Failed to get stats: {e}")
-        raise typer.Exit(1)
+    stats_items = client.stats()
+    if app_context.output_format is OutputFormat.JSON:
+        # The to_dict() default hook lets the serializer walk the models
+        # directly, with no intermediate list of dicts.
+        _print_json(stats_items)
+    else:
+        sys.stdout.write("".join(_STATS_TMPL.format_map(item.to_dict()) for item in stats_items))
 
 
 @app.command()
+@handle_slugkit_errors("Failed to get series info")
 def series_info(
     series: str | None = typer.Option(None, "--series", "-s", help="The series to use for the info."),
 ):
     """
     Get information about the current series.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
+    client = get_client()
     if series:
         client = client.series[series]
     else:
         client = client.series
-    try:
-        series_info = client.info()
-        if app_context.output_format == OutputFormat.JSON:
-            # Convert SeriesInfo object to dictionary for JSON serialization
-            series_dict = series_info.to_dict()
-            print(json.dumps(series_dict, indent=2))
-        else:
-            print_series_info(series_info)
-    except SlugKitError as e:
-        logger.error(f"Failed to get series info: {e}")
-        raise typer.Exit(1)
+    series_info = client.info()
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(series_info)
+    else:
+        sys.stdout.write(_SERIES_INFO_TMPL.format_map(series_info.to_dict()))
 
 
 @app.command()
+@handle_slugkit_errors("Failed to get series list")
 def list_series():
     """
     Get the list of available series.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        series_list = client.series.list()
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(series_list, indent=2))
+    client = get_client()
+    series_list = client.series.list()
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(series_list)
+    else:
+        print("Series:")
+        if isinstance(series_list, list):
+            _print_lines(series_list)
+        elif isinstance(series_list, dict):
+            caption_width = 25
+            for key, name in series_list.items():
+                print(f"{key:<{caption_width}}: {name}")
         else:
-            print("Series:")
-            if isinstance(series_list, list):
-                for series in series_list:
-                    print(series)
-            elif isinstance(series_list, dict):
-                caption_width = 25
-                for key, name in series_list.items():
-                    print(f"{key:<{caption_width}}: {name}")
-            else:
-                print(series_list)
-    except SlugKitError as e:
-        logger.error(f"Failed to get series list: {e}")
-        raise typer.Exit(1)
+            print(series_list)
 
 
 @app.command()
+@handle_slugkit_errors("Failed to create series")
 def create_series(
     name: str = typer.Argument(..., help="The name of the series."),
     pattern: str = typer.Argument(..., help="The pattern of the series."),
@@ -396,19 +647,16 @@ def create_series(
     """
     Create a new series.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        series_info = client.series.create(name, pattern)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(series_info.to_dict(), indent=2))
-        else:
-            print_series_info(series_info)
-    except SlugKitError as e:
-        logger.error(f"Failed to create series: {e}")
-        raise typer.Exit(1)
+    client = get_client()
+    series_info = client.series.create(name, pattern)
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(series_info)
+    else:
+        print_series_info(series_info)
 
 
 @app.command()
+@handle_slugkit_errors("Failed to update series")
 def update_series(
     series: str | None = typer.Option(None, "--series", "-s", help="The series to use for the info."),
     name: str = typer.Argument(..., help="The name of the series."),
@@ -417,57 +665,47 @@ def update_series(
     """
     Update a series.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
+    client = get_client()
     if series:
         client = client.series[series]
     else:
         client = client.series
-    try:
-        series_info = client.update(name, pattern)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(series_info.to_dict(), indent=2))
-        else:
-            print_series_info(series_info)
-    except SlugKitError as e:
-        logger.error(f"Failed to update series: {e}")
-        raise typer.Exit(1)
+    series_info = client.update(name, pattern)
+    if app_context.output_format is OutputFormat.JSON:
+        _print_json(series_info)
+    else:
+        print_series_info(series_info)
 
 
 @app.command()
+@handle_slugkit_errors("Failed to delete series")
 def delete_series(
     series: str = typer.Option(..., "--series", "-s", help="The series to use for the info."),
 ):
     """
     Delete a series.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key).series[series]
-    try:
-        client.delete()
-        logger.info(f"Series {series} deleted")
-    except SlugKitError as e:
-        logger.error(f"Failed to delete series: {e}")
-        raise typer.Exit(1)
+    client = get_client().series[series]
+    client.delete()
+    logger.info(f"Series {series} deleted")
 
 
 @app.command()
+@handle_slugkit_errors("Failed to reset generator")
 def reset(
     series: str | None = typer.Option(None, "--series", "-s", help="The series to use for the reset."),
 ):
     """
     Reset the generator.
     """
-    try:
-        logger.warning(f"Resetting generator at {app_context.base_url}")
-        client = SyncClient(app_context.base_url, app_context.api_key)
-        if series:
-            client = client.series[series]
-        else:
-            client = client.series
-        client.reset()
-        logger.info("Generator reset")
-    except SlugKitError as e:
-        logger.error(f"Failed to reset generator: {e}")
-        raise typer.Exit(1)
+    logger.warning(f"Resetting generator at {app_context.base_url}")
+    client = get_client()
+    if series:
+        client = client.series[series]
+    else:
+        client = client.series
+    client.reset()
+    logger.info("Generator reset")
 
 
 @app.command()
@@ -475,21 +713,7 @@ def validate(pattern: str):
     """
     Get information about a pattern.
     """
-    client = SyncClient(app_context.base_url, app_context.api_key)
-    try:
-        pattern_info = client.forge.pattern_info(pattern)
-        if app_context.output_format == OutputFormat.JSON:
-            print(json.dumps(pattern_info.to_dict(), indent=2))
-        else:
-            caption_width = 25
-            print(f"{'Pattern':<{caption_width}}: {pattern_info.pattern}")
-            print(f"{'Capacity':<{caption_width}}: {pattern_info.capacity}")
-            print(f"{'Max Slug Length':<{caption_width}}: {pattern_info.max_slug_length}")
-            print(f"{'Complexity':<{caption_width}}: {pattern_info.complexity}")
-            print(f"{'Components':<{caption_width}}: {pattern_info.components}")
-    except SlugKitError as e:
-        logger.error(f"Failed to validate pattern: {e}")
-        raise typer.Exit(1)
+    _render_pattern_info(pattern)
 
 
 @app.command()
@@ -510,7 +734,24 @@ def doc(file: str):
 
 
 def main():
-    dotenv.load_dotenv()
+    # Configure logging at dispatch time, not import time: --help and the
+    # offline commands never log, and SLUGKIT_LOG=off skips it entirely.
+    log_level = os.environ.get("SLUGKIT_LOG", "info")
+    if log_level != "off":
+        logging.basicConfig(level=log_level.upper())
+        logging.getLogger("httpx").setLevel(logging.ERROR)
+    # load_dotenv stats the whole directory chain looking for a .env file;
+    # skip it when the environment is already configured (or opted out).
+    if not os.environ.get("SLUGKIT_SKIP_DOTENV") and not (
+        os.environ.get("SLUGKIT_BASE_URL") and os.environ.get("SLUGKIT_API_KEY")
+    ):
+        import dotenv
+
+        dotenv.load_dotenv()
+    atexit.register(_close_client)
+    if hasattr(sys.stdout, "reconfigure"):
+        # No per-line flushing; _print_lines flushes per chunk instead.
+        sys.stdout.reconfigure(line_buffering=False, write_through=False)
     app()
 
 
@@ -2,14 +2,22 @@
 Error handling utilities for SlugKit SDK.
 """
 
+import asyncio
+import functools
 import time
 import json
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Optional, Any
-from enum import Enum
 import httpx
 
+# Dedicated generator so threads computing backoff don't contend on the
+# random module's shared global instance.
+_rng = random.Random()
 
-class ErrorSeverity(Enum):
+
+class ErrorSeverity:
     """Error severity levels for categorization."""
 
     LOW = "low"
@@ -217,221 +225,224 @@ class SlugKitConfigurationError(SlugKitError):
     pass
 
 
-def get_error_recovery_suggestions(error: SlugKitError) -> list[str]:
-    """Get actionable recovery suggestions for an error."""
-    suggestions = []
-
-    if isinstance(error, SlugKitConnectionError):
-        suggestions.extend(
-            [
-                "Verify the server URL is correct and accessible",
-                "Check your internet connection",
-                "Try again in a few moments (network issues are often temporary)",
-                "Verify firewall/proxy settings if applicable",
-            ]
-        )
-
-    elif isinstance(error, SlugKitAuthenticationError):
-        suggestions.extend(
-            [
-                "Verify your API key is correct and not expired",
-                "Check that your API key has the required permissions",
-                "Ensure the API key is properly formatted",
-                "Contact support if the issue persists",
-            ]
-        )
-
-    elif isinstance(error, SlugKitClientError):
-        suggestions.extend(
-            [
-                "Review the request parameters and format",
-                "Check the API documentation for correct usage",
-                "Verify all required fields are provided",
-                "Ensure data types match expected formats",
-            ]
-        )
-
-    elif isinstance(error, SlugKitValidationError):
-        suggestions.extend(
-            [
-                "Review the input data for format issues",
-                "Check that all required fields are present",
-                "Verify data types and constraints",
-                "Use the validate_pattern tool to check pattern syntax",
-            ]
-        )
-
-    elif isinstance(error, SlugKitRateLimitError):
-        # Provide context-specific suggestions based on rate limit reason
-        reason = getattr(error, 'rate_limit_reason', None) if hasattr(error, 'rate_limit_reason') else None
-
-        if reason == 'not-available':
-            # Feature not available
-            suggestions.extend(
-                [
-                    "This feature is not available with your current subscription",
-                    "Check your subscription plan and limits",
-                    "Contact support to enable this feature",
-                    "Consider upgrading your subscription plan",
-                ]
-            )
-        elif reason == 'request-size-exceeded':
-            # Request size too large
-            suggestions.extend(
-                [
-                    "Your request size exceeds the maximum allowed",
-                    "Reduce the number of items in your request",
-                    "Split large requests into smaller batches",
-                    "Check the API documentation for size limits",
-                ]
-            )
-        elif reason in {'monthly-limit-exceeded', 'lifetime-limit-exceeded'}:
-            # Long-term limits without accurate retry-after
-            limit_type = 'monthly' if reason == 'monthly-limit-exceeded' else 'lifetime'
-            suggestions.extend(
-                [
-                    f"You have reached your {limit_type} quota",
-                    "Wait until the next billing period or quota reset" if limit_type == 'monthly' else "Your lifetime quota has been exhausted",
-                    "Check your usage dashboard for quota renewal date",
-                    "Consider upgrading to a plan with higher limits",
-                    "Retrying will not help until quotas reset",
-                ]
-            )
-        elif reason in {'rate-limit-exceeded', 'daily-limit-exceeded'}:
-            # Short-term token bucket limits with accurate retry-after
-            limit_type = 'rate' if reason == 'rate-limit-exceeded' else 'daily'
-            retry_after = getattr(error, 'retry_after', None) if hasattr(error, 'retry_after') else None
-            if retry_after and retry_after > 0:
-                suggestions.extend(
-                    [
-                        f"{limit_type.capitalize()} limit will reset in {retry_after} seconds",
-                        "The SDK will automatically retry with proper backoff",
-                        "Reduce request frequency to stay within limits",
-                        "Check your current quota status",
-                    ]
-                )
-            else:
-                suggestions.extend(
-                    [
-                        f"You have exceeded your {limit_type} limit",
-                        "The SDK will automatically retry with proper backoff",
-                        "Reduce request frequency to stay within limits",
-                        "Check your current usage limits and quotas",
-                    ]
-                )
-        elif reason == 'redis-error':
-            # Server-side Redis error
-            suggestions.extend(
-                [
-                    "A server-side error occurred while checking rate limits",
-                    "This is a temporary server issue, not a client problem",
-                    "Try again in a few moments",
-                    "Contact support if the issue persists",
-                ]
-            )
-        else:
-            # Unknown or unspecified reason - generic advice
-            suggestions.extend(
-                [
-                    "Wait before making additional requests",
-                    "Reduce request frequency",
-                    "Check your current usage limits and quotas",
-                    "Review the rate limit reason for more details",
-                ]
-            )
-
-    elif isinstance(error, SlugKitServerError):
-        suggestions.extend(
-            [
-                "Try again in a few moments",
-                "Check the service status page",
-                "Contact support if the issue persists",
-                "Verify the request is not too complex",
-            ]
-        )
-
-    elif isinstance(error, SlugKitTimeoutError):
-        suggestions.extend(
-            [
-                "Check your network connection",
-                "Try again with a longer timeout",
-                "Reduce request complexity if possible",
-                "Verify server responsiveness",
-            ]
-        )
-
-    elif isinstance(error, SlugKitQuotaError):
-        suggestions.extend(
-            [
-                "Check your current usage and limits",
-                "Consider upgrading your plan if needed",
-                "Review usage patterns and optimize",
-                "Contact support for quota increases",
-            ]
-        )
+# Generic suggestions appended for any error; interned once at import.
+_GENERIC_SUGGESTIONS: tuple[str, ...] = (
+    "Check the SlugKit documentation for troubleshooting",
+    "Review the error context for additional details",
+    "Enable debug logging for more information",
+    "Contact support with the full error details if the issue persists",
+)
+
+_RECOVERY_SUGGESTIONS: dict[type[Exception], tuple[str, ...]] = {
+    SlugKitConnectionError: (
+        "Check your internet connection",
+        "Verify the server URL is correct and accessible",
+        "Try again in a few moments (network issues are often temporary)",
+        "Check if there are any firewall or proxy restrictions",
+    ),
+    SlugKitAuthenticationError: (
+        "Verify your API key is correct",
+        "Check if your API key has expired",
+        "Ensure your API key has the required permissions",
+        "Contact support if the issue persists",
+    ),
+    SlugKitValidationError: (
+        "Review the pattern syntax in the SlugKit documentation",
+        "Check for balanced braces and valid placeholder names",
+        "Verify number generator syntax (e.g., {number:3d})",
+        "Use validate_pattern() to test your pattern before use",
+    ),
+    SlugKitTimeoutError: (
+        "The operation may complete if you wait longer",
+        "Consider reducing the batch size for large operations",
+        "Check your network latency to the server",
+        "Try again during off-peak hours",
+    ),
+    SlugKitRateLimitError: (
+        "Wait before making additional requests",
+        "Implement exponential backoff in your application",
+        "Consider upgrading your plan for higher rate limits",
+        "Batch multiple operations together when possible",
+    ),
+    SlugKitQuotaError: (
+        "Check your current usage against your plan limits",
+        "Consider upgrading your plan for higher quotas",
+        "Review and optimize your slug generation patterns",
+        "Contact support to discuss quota increases",
+    ),
+    SlugKitConfigurationError: (
+        "Verify your configuration settings",
+        "Check environment variables are set correctly",
+        "Review the configuration documentation",
+        "Ensure all required fields are provided",
+    ),
+}
+
+# Context-specific suggestions keyed by X-Slug-Rate-Limit-Reason.
+_RATE_LIMIT_REASON_SUGGESTIONS: dict[str, tuple[str, ...]] = {
+    "not-available": (
+        "This feature is not available with your current subscription",
+        "Check your subscription plan and limits",
+        "Contact support to enable this feature",
+        "Consider upgrading your subscription plan",
+    ),
+    "request-size-exceeded": (
+        "Your request size exceeds the maximum allowed",
+        "Reduce the number of items in your request",
+        "Split large requests into smaller batches",
+        "Check the API documentation for size limits",
+    ),
+    "monthly-limit-exceeded": (
+        "You have reached your monthly quota",
+        "Wait until the next billing period or quota reset",
+        "Check your usage dashboard for quota renewal date",
+        "Consider upgrading to a plan with higher limits",
+        "Retrying will not help until quotas reset",
+    ),
+    "lifetime-limit-exceeded": (
+        "You have reached your lifetime quota",
+        "Your lifetime quota has been exhausted",
+        "Check your usage dashboard for quota renewal date",
+        "Consider upgrading to a plan with higher limits",
+        "Retrying will not help until quotas reset",
+    ),
+    "rate-limit-exceeded": (
+        "You have exceeded your rate limit",
+        "The SDK will automatically retry with proper backoff",
+        "Reduce request frequency to stay within limits",
+        "Check your current usage limits and quotas",
+    ),
+    "daily-limit-exceeded": (
+        "You have exceeded your daily limit",
+        "The SDK will automatically retry with proper backoff",
+        "Reduce request frequency to stay within limits",
+        "Check your current usage limits and quotas",
+    ),
+    "redis-error": (
+        "A server-side error occurred while checking rate limits",
+        "This is a temporary server issue, not a client problem",
+        "Try again in a few moments",
+        "Contact support if the issue persists",
+    ),
+}
+
+# Append the generic tail once at import so each lookup returns a single
+# fully-built tuple instead of concatenating per call.
+_RECOVERY_SUGGESTIONS = {cls: specific + _GENERIC_SUGGESTIONS for cls, specific in _RECOVERY_SUGGESTIONS.items()}
+_RATE_LIMIT_REASON_SUGGESTIONS = {
+    reason: specific + _GENERIC_SUGGESTIONS for reason, specific in _RATE_LIMIT_REASON_SUGGESTIONS.items()
+}
+
+
+def get_error_recovery_suggestions(error: Exception) -> list[str]:
+    """
+    Get recovery suggestions for different types of errors.
 
-    else:
-        suggestions.extend(
-            [
-                "Review the error message for specific details",
-                "Check the API documentation",
-                "Try with simpler parameters first",
-                "Contact support if the issue persists",
-            ]
-        )
-
-    return suggestions
-
-
-def categorize_error(error: SlugKitError) -> dict[str, Any]:
-    """Categorize an error for better understanding and handling."""
-    if isinstance(error, SlugKitConnectionError):
-        severity = ErrorSeverity.HIGH
-        category = "connectivity"
-        retryable = True
-    elif isinstance(error, SlugKitAuthenticationError):
-        severity = ErrorSeverity.CRITICAL
-        category = "authentication"
-        retryable = False
-    elif isinstance(error, SlugKitClientError):
-        severity = ErrorSeverity.MEDIUM
-        category = "client"
-        retryable = False
-    elif isinstance(error, SlugKitServerError):
-        severity = ErrorSeverity.HIGH
-        category = "server"
-        retryable = True
-    elif isinstance(error, SlugKitRateLimitError):
-        severity = ErrorSeverity.MEDIUM
-        category = "rate_limit"
-        retryable = True
-    elif isinstance(error, SlugKitValidationError):
-        severity = ErrorSeverity.LOW
-        category = "validation"
-        retryable = False
-    elif isinstance(error, SlugKitTimeoutError):
-        severity = ErrorSeverity.MEDIUM
-        category = "timeout"
-        retryable = True
-    elif isinstance(error, SlugKitQuotaError):
-        severity = ErrorSeverity.HIGH
-        category = "quota"
-        retryable = False
-    elif isinstance(error, SlugKitConfigurationError):
-        severity = ErrorSeverity.CRITICAL
-        category = "configuration"
-        retryable = False
-    else:
-        severity = ErrorSeverity.MEDIUM
-        category = "unknown"
-        retryable = False
+    The suggestions are looked up in a type-keyed table (walking the MRO
+    so subclasses match) instead of an isinstance ladder re-evaluated on
+    every error. Rate limit errors with a known X-Slug-Rate-Limit-Reason
+    get context-specific suggestions instead of the generic per-type set.
+
+    Args:
+        error: The exception that occurred
+
+    Returns:
+        List of human-readable recovery suggestions
+    """
+    if isinstance(error, SlugKitRateLimitError):
+        reason = getattr(error, "rate_limit_reason", None)
+        specific = _RATE_LIMIT_REASON_SUGGESTIONS.get(reason) if reason else None
+        if specific is not None:
+            retry_after = getattr(error, "retry_after", None)
+            if retry_after and retry_after > 0 and reason in ("rate-limit-exceeded", "daily-limit-exceeded"):
+                limit_type = "Rate" if reason == "rate-limit-exceeded" else "Daily"
+                return [f"{limit_type} limit will reset in {retry_after} seconds", *specific[1:]]
+            return list(specific)
+    for cls in type(error).__mro__:
+        specific = _RECOVERY_SUGGESTIONS.get(cls)
+        if specific is not None:
+            return list(specific)
+    return list(_GENERIC_SUGGESTIONS)
+
+
+_ERROR_CATEGORIES: dict[type[Exception], dict[str, Any]] = {
+    SlugKitConnectionError: {
+        "type": "connectivity",
+        "severity": ErrorSeverity.MEDIUM,
+        "retryable": True,
+        "user_actionable": True,
+    },
+    SlugKitAuthenticationError: {
+        "type": "authentication",
+        "severity": ErrorSeverity.HIGH,
+        "retryable": False,
+        "user_actionable": True,
+    },
+    SlugKitValidationError: {
+        "type": "validation",
+        "severity": ErrorSeverity.LOW,
+        "retryable": False,
+        "user_actionable": True,
+    },
+    SlugKitTimeoutError: {
+        "type": "performance",
+        "severity": ErrorSeverity.MEDIUM,
+        "retryable": True,
+        "user_actionable": True,
+    },
+    SlugKitRateLimitError: {
+        "type": "rate_limiting",
+        "severity": ErrorSeverity.MEDIUM,
+        "retryable": True,
+        "user_actionable": True,
+    },
+    SlugKitQuotaError: {
+        "type": "quota",
+        "severity": ErrorSeverity.HIGH,
+        "retryable": False,
+        "user_actionable": True,
+    },
+    SlugKitConfigurationError: {
+        "type": "configuration",
+        "severity": ErrorSeverity.HIGH,
+        "retryable": False,
+        "user_actionable": True,
+    },
+    SlugKitServerError: {
+        "type": "server",
+        "severity": ErrorSeverity.HIGH,
+        "retryable": True,
+        "user_actionable": False,
+    },
+}
+
+_UNKNOWN_CATEGORY: dict[str, Any] = {
+    "type": "unknown",
+    "severity": ErrorSeverity.MEDIUM,
+    "retryable": False,
+    "user_actionable": False,
+}
+
+
+def categorize_error(error: Exception) -> dict:
+    """
+    Categorize an error with severity and type information.
+
+    Uses the same type-keyed table dispatch as
+    get_error_recovery_suggestions; a copy is returned so callers may
+    mutate the result freely.
+
+    Args:
+        error: The exception that occurred
 
-    return {
-        "severity": severity.value,
-        "category": category,
-        "retryable": retryable,
-        "suggestions": get_error_recovery_suggestions(error),
-    }
+    Returns:
+        Dictionary with error categorization
+    """
+    for cls in type(error).__mro__:
+        category = _ERROR_CATEGORIES.get(cls)
+        if category is not None:
+            return dict(category)
+    return dict(_UNKNOWN_CATEGORY)
 
 
 def extract_error_info(response_text: str) -> tuple[str, dict]:
@@ -561,16 +572,36 @@ def handle_http_error(
         return SlugKitClientError(error_message, cause=error, context=context)
 
 
-def should_retry_error(error: Exception) -> bool:
-    """Determine if an error should trigger a retry."""
+@functools.lru_cache(maxsize=None)
+def _retry_verdict_for_type(error_type: type[BaseException]) -> bool | None:
+    """
+    Class-level retryability verdict, cached per exception type.
+
+    Returns True/False when retryability is decided by the type alone,
+    or None when it depends on instance state (HTTP status code or
+    rate limit reason).
+    """
     # Retry on connection errors, timeouts, and 5xx server errors
-    if isinstance(error, (httpx.ConnectError, httpx.TimeoutException)):
+    if issubclass(error_type, (httpx.ConnectError, httpx.TimeoutException)):
         return True
 
     # Retry on SlugKit connection errors
-    if isinstance(error, SlugKitConnectionError):
+    if issubclass(error_type, SlugKitConnectionError):
         return True
 
+    # 5xx-vs-4xx and rate limit reasons need the instance
+    if issubclass(error_type, (httpx.HTTPStatusError, SlugKitRateLimitError)):
+        return None
+
+    return False
+
+
+def should_retry_error(error: Exception) -> bool:
+    """Determine if an error should trigger a retry."""
+    verdict = _retry_verdict_for_type(type(error))
+    if verdict is not None:
+        return verdict
+
     # Retry on 5xx server errors (server issues)
     if isinstance(error, httpx.HTTPStatusError):
         return 500 <= error.response.status_code < 600
@@ -619,35 +650,100 @@ def should_retry_error(error: Exception) -> bool:
     return False
 
 
-def calculate_backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 60.0) -> float:
-    """Calculate exponential backoff delay with jitter."""
-    import random
+def calculate_backoff_delay(
+    attempt: int,
+    base_delay: float = 1.0,
+    max_delay: float = 60.0,
+    retry_after: int | None = None
+) -> float:
+    """
+    Calculate exponential backoff delay with jitter.
+
+    If retry_after is provided (from rate limit header), use that instead.
+
+    Args:
+        attempt: Current attempt number (1-based)
+        base_delay: Base delay in seconds (default: 1.0)
+        max_delay: Maximum delay in seconds (default: 60.0)
+        retry_after: Explicit retry delay from server (e.g., X-Slug-Retry-After header)
+
+    Returns:
+        Delay in seconds before next retry
+    """
+    # If server explicitly tells us when to retry, respect that
+    if retry_after is not None and retry_after > 0:
+        return float(retry_after)
 
     # Exponential backoff: base_delay * 2^(attempt-1)
-    delay = min(base_delay * (2 ** (attempt - 1)), max_delay)
+    delay = min(base_delay * (1 << (attempt - 1)), max_delay)
 
     # Add jitter (±25% random variation)
-    jitter = random.uniform(0.75, 1.25)
+    jitter = _rng.uniform(0.75, 1.25)
     delay = delay * jitter
 
     return delay
 
 
+def _parse_retry_after_header(value: str | None) -> int | None:
+    """Parse a Retry-After header in either integer-seconds or HTTP-date form."""
+    if not value:
+        return None
+    try:
+        return int(value)
+    except (TypeError, ValueError):
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0, int((when - datetime.now(timezone.utc)).total_seconds()))
+
+
+def _retry_after(e: Exception) -> int | None:
+    """
+    Extract a server-provided retry delay from an error.
+
+    Rate limit errors carry it directly; raw 429/503 responses that have
+    not been wrapped yet may still advertise one via the standard
+    Retry-After header.
+    """
+    if isinstance(e, SlugKitRateLimitError):
+        return getattr(e, "retry_after", None)
+    if isinstance(e, httpx.HTTPStatusError) and e.response.status_code in (429, 503):
+        return _parse_retry_after_header(e.response.headers.get("retry-after"))
+    return None
+
+
 def retry_with_backoff(
     max_attempts: int = 3,
     base_delay: float = 1.0,
     max_delay: float = 60.0,
     retryable_errors: tuple[type[Exception], ...] | None = None,
+    deadline_s: float | None = None,
 ):
-    """Decorator that adds retry logic with exponential backoff to functions."""
+    """
+    Decorator that adds retry logic with exponential backoff to functions.
 
-    def decorator(func):
-        import functools
-        import asyncio
+    When deadline_s is given, retries also stop once the next sleep would
+    overrun that wall-clock budget (measured from call entry on the
+    monotonic clock), bounding worst-case latency regardless of how many
+    attempts remain.
+    """
+
+    # The retry classifier is fixed for the lifetime of the decorated
+    # function, so resolve it once here instead of branching per attempt.
+    if retryable_errors:
+        _classify = lambda e: isinstance(e, retryable_errors)  # noqa: E731
+    else:
+        _classify = should_retry_error
 
+    def decorator(func):
         @functools.wraps(func)
         def sync_wrapper(*args, **kwargs):
             last_error = None
+            deadline = time.monotonic() + deadline_s if deadline_s is not None else None
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -655,19 +751,13 @@ def retry_with_backoff(
                 except Exception as e:
                     last_error = e
 
-                    # Check if we should retry
-                    if retryable_errors:
-                        should_retry = isinstance(e, retryable_errors)
-                    else:
-                        should_retry = should_retry_error(e)
-
-                    if not should_retry or attempt == max_attempts:
+                    if not _classify(e) or attempt == max_attempts:
                         break
 
                     # Calculate delay and wait
-                    delay = calculate_backoff_delay(attempt, base_delay, max_delay)
-                    import time
-
+                    delay = calculate_backoff_delay(attempt, base_delay, max_delay, _retry_after(e))
+                    if deadline is not None and time.monotonic() + delay > deadline:
+                        break
                     time.sleep(delay)
 
             # Re-raise the last error
@@ -676,6 +766,7 @@ def retry_with_backoff(
         @functools.wraps(func)
         async def async_wrapper(*args, **kwargs):
             last_error = None
+            deadline = time.monotonic() + deadline_s if deadline_s is not None else None
 
             for attempt in range(1, max_attempts + 1):
                 try:
@@ -683,17 +774,13 @@ def retry_with_backoff(
                 except Exception as e:
                     last_error = e
 
-                    # Check if we should retry
-                    if retryable_errors:
-                        should_retry = isinstance(e, retryable_errors)
-                    else:
-                        should_retry = should_retry_error(e)
-
-                    if not should_retry or attempt == max_attempts:
+                    if not _classify(e) or attempt == max_attempts:
                         break
 
                     # Calculate delay and wait
-                    delay = calculate_backoff_delay(attempt, base_delay, max_delay)
+                    delay = calculate_backoff_delay(attempt, base_delay, max_delay, _retry_after(e))
+                    if deadline is not None and time.monotonic() + delay > deadline:
+                        break
                     await asyncio.sleep(delay)
 
             # Re-raise the last error
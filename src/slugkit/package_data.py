@@ -1,3 +1,4 @@
+import functools
 import importlib.resources as pkg_resources
 from importlib.resources.abc import Traversable
 from typing import Generator, Callable
@@ -55,10 +56,19 @@ def _enumerate_package_directory(
             yield path + item.name
 
 
-def list_package_files(root: str = "data", *, filter: Callable[[str], bool] | None = None) -> list[str]:
+@functools.lru_cache(maxsize=None)
+def _list_package_files_cached(root: str) -> tuple[str, ...]:
+    """Walk the packaged data directory once per root; the install never changes."""
     data_ref = pkg_resources.files(_get_package_root_name())
     for part in root.split("/"):
         if not part:
             continue
         data_ref = data_ref / part
-    return [f for f in _enumerate_package_directory(data_ref, filter=filter)]
+    return tuple(_enumerate_package_directory(data_ref))
+
+
+def list_package_files(root: str = "data", *, filter: Callable[[str], bool] | None = None) -> list[str]:
+    files = _list_package_files_cached(root)
+    if filter is not None:
+        return [f for f in files if filter(f.rsplit("/", 1)[-1])]
+    return list(files)
@@ -3,7 +3,7 @@ import os
 import logging
 import functools
 
-from typing import Any, Generator, Callable
+from typing import Any, Generator, Callable, Iterator
 from .base import (
     DictionaryInfo,
     PaginatedTags,
@@ -28,36 +28,92 @@ from .base import (
     categorize_error,
     handle_http_error,
     Endpoints,
+    STATS_LIST_ADAPTER,
+    DICTIONARY_INFO_LIST_ADAPTER,
     DEFAULT_BATCH_SIZE,
+    DEFAULT_STREAM_CHUNK_SIZE,
+    _TTLCache,
+    cache_ttl_from_headers,
+    json_request_args,
+    split_stream_lines,
+    decode_stream_lines,
 )
 
 logger = logging.getLogger(__name__)
 
+# Endpoint paths bound once at import; Enum member + .value lookups on
+# every request are measurably slower than a module-level constant.
+_PING = Endpoints.PING.value
+_KEY_INFO = Endpoints.KEY_INFO.value
+_LIMITS = Endpoints.LIMITS.value
+_FORGE = Endpoints.FORGE.value
+_RESET = Endpoints.RESET.value
+_STATS = Endpoints.STATS.value
+_SERIES_LIST = Endpoints.SERIES_LIST.value
+_SERIES_CREATE = Endpoints.SERIES_CREATE.value
+_SERIES_UPDATE = Endpoints.SERIES_UPDATE.value
+_SERIES_DELETE = Endpoints.SERIES_DELETE.value
+_SERIES_INFO = Endpoints.SERIES_INFO.value
+_PATTERN_INFO = Endpoints.PATTERN_INFO.value
+_DICTIONARY_INFO = Endpoints.DICTIONARY_INFO.value
+_DICTIONARY_TAGS = Endpoints.DICTIONARY_TAGS.value
+
 
 class SyncSlugGenerator(GeneratorBase):
+    __slots__ = ()
+
     def __call__(
         self,
         count: int = 1,
     ) -> list[str]:
-        req = self._get_request(count)
+        req = self._get_request(count, self._sequence)
         path = self._get_path()
 
         self._logger.debug(f"Requesting {count} slug(s)")
         try:
             response = self._http_client().post(
                 path,
-                json=req,
+                **json_request_args(req),
             )
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
             raise handle_http_error(e, "mint_slugs", path)
 
+    def _iter_stream(self, count: int, sequence: int | None = None) -> Iterator[str]:
+        """
+        Stream a single batch of ``count`` slugs, yielding them one at a time.
+
+        The response body is consumed in chunks and only one partial line is
+        buffered, so memory stays bounded regardless of batch size.
+        """
+        path = self._get_path(stream=True)
+        # The factory returns the shared pooled client; do not
+        # context-manage it here or the pool would be closed
+        # after every batch.
+        client = self._http_client()
+        req = self._get_request(count, sequence)
+        try:
+            with client.stream(
+                "POST",
+                path,
+                **json_request_args(req),
+            ) as response:
+                response.raise_for_status()
+
+                buffer = bytearray()
+                for chunk in response.iter_bytes(DEFAULT_STREAM_CHUNK_SIZE):
+                    lines, buffer = split_stream_lines(buffer, chunk)
+                    yield from decode_stream_lines(lines)
+                if buffer:
+                    yield from decode_stream_lines([bytes(buffer)])
+        except httpx.HTTPStatusError as e:
+            raise handle_http_error(e, "stream_slugs", path)
+
     def stream(self) -> Generator[str, Any, int]:
         count = 0
         limit = self._limit
         batch_size = self._batch_size
-        path = self._get_path(stream=True)
         sequence = self._sequence
         try:
             while True:
@@ -65,26 +121,15 @@ class SyncSlugGenerator(GeneratorBase):
                     batch_size = min(batch_size, limit - count)
                 if batch_size <= 0:
                     break
-                with self._http_client() as client:
-                    req = self._get_request(batch_size, sequence)
-                    self._logger.debug(f"Requesting batch of {batch_size} slug(s)")
-                    with client.stream(
-                        "POST",
-                        path,
-                        json=req,
-                    ) as response:
-                        response.raise_for_status()
-
-                        for val in response.iter_lines():
-                            stop = yield val.strip()
-                            count += 1
-                            if stop is not None:
-                                break
-                            if limit is not None and count >= limit:
-                                break
+                self._logger.debug(f"Requesting batch of {batch_size} slug(s)")
+                for val in self._iter_stream(batch_size, sequence):
+                    stop = yield val
+                    count += 1
+                    if stop is not None:
+                        break
+                    if limit is not None and count >= limit:
+                        break
                 sequence += batch_size
-        except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "stream_slugs", path)
         except KeyboardInterrupt:
             ...
         self._logger.debug(f"Generated {count} slugs")
@@ -95,8 +140,11 @@ class SyncSlugGenerator(GeneratorBase):
 
 
 class RandomGenerator(GeneratorBase):
+    __slots__ = ("_metadata_cache",)
+
     def __init__(self, http_client: Callable[[], httpx.Client]):
         self._http_client = http_client
+        self._metadata_cache = _TTLCache()
 
     def __call__(
         self,
@@ -117,45 +165,52 @@ class RandomGenerator(GeneratorBase):
             req["count"] = count
         try:
             response = self._http_client().post(
-                Endpoints.FORGE.value,
-                json=req,
+                _FORGE,
+                **json_request_args(req),
             )
             response.raise_for_status()
             return response.json()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "forge_slugs", Endpoints.FORGE.value, pattern=pattern)
+            raise handle_http_error(e, "forge_slugs", _FORGE, pattern=pattern)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def pattern_info(self, pattern: str) -> PatternInfo:
+        cached = self._metadata_cache.get((_PATTERN_INFO, pattern))
+        if cached is not None:
+            return cached
         try:
-            response = self._http_client().post(Endpoints.PATTERN_INFO.value, json={"pattern": pattern})
+            response = self._http_client().post(_PATTERN_INFO, **json_request_args({"pattern": pattern}))
             response.raise_for_status()
-            data = response.json()
-            return PatternInfo.from_dict(data)
+            info = PatternInfo.model_validate_json(response.content)
+            self._metadata_cache.set((_PATTERN_INFO, pattern), info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "pattern_info", Endpoints.PATTERN_INFO.value)
+            raise handle_http_error(e, "pattern_info", _PATTERN_INFO)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def dictionary_info(self) -> list[DictionaryInfo]:
+        cached = self._metadata_cache.get(_DICTIONARY_INFO)
+        if cached is not None:
+            return cached
         try:
-            response = self._http_client().get(Endpoints.DICTIONARY_INFO.value)
+            response = self._http_client().get(_DICTIONARY_INFO)
             response.raise_for_status()
-            data = response.json()
-            return [DictionaryInfo.from_dict(item) for item in data]
+            info = DICTIONARY_INFO_LIST_ADAPTER.validate_json(response.content)
+            self._metadata_cache.set(_DICTIONARY_INFO, info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "dictionary_info", Endpoints.DICTIONARY_INFO.value)
+            raise handle_http_error(e, "dictionary_info", _DICTIONARY_INFO)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def dictionary_tags(self, kind: str, *, limit: int = 100, offset: int = 0) -> PaginatedTags:
         try:
             response = self._http_client().get(
-                f"{Endpoints.DICTIONARY_TAGS.value}/{kind}?limit={limit}&offset={offset}"
+                f"{_DICTIONARY_TAGS}/{kind}?limit={limit}&offset={offset}"
             )
             response.raise_for_status()
-            data = response.json()
-            return PaginatedTags.from_dict(data)
+            return PaginatedTags.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "dictionary_tags", Endpoints.DICTIONARY_TAGS.value)
+            raise handle_http_error(e, "dictionary_tags", _DICTIONARY_TAGS)
 
 
 class SeriesClient:
@@ -163,6 +218,7 @@ class SeriesClient:
         self._http_client = httpx_client
         self._series: str | None = series_slug
         self._logger = logging.getLogger(f"{self.__class__.__name__}")
+        self._metadata_cache = _TTLCache()
 
     def __getitem__(self, series_slug: str) -> "SeriesClient":
         return self.with_series(series_slug)
@@ -202,25 +258,28 @@ class SeriesClient:
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = self._http_client().post(Endpoints.STATS.value, json=req)
+            response = self._http_client().post(_STATS, **json_request_args(req))
             response.raise_for_status()
-            data = response.json()
-            return [StatsItem.from_dict(item) for item in data]
+            return STATS_LIST_ADAPTER.validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_stats", Endpoints.STATS.value)
+            raise handle_http_error(e, "series_stats", _STATS)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def info(self) -> SeriesInfo:
+        cached = self._metadata_cache.get((_SERIES_INFO, self._series))
+        if cached is not None:
+            return cached
         try:
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = self._http_client().post(Endpoints.SERIES_INFO.value, json=req)
+            response = self._http_client().post(_SERIES_INFO, **json_request_args(req))
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            info = SeriesInfo.model_validate_json(response.content)
+            self._metadata_cache.set((_SERIES_INFO, self._series), info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_info", Endpoints.SERIES_INFO.value)
+            raise handle_http_error(e, "series_info", _SERIES_INFO)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def list(self) -> dict[str, str]:
@@ -228,46 +287,47 @@ class SeriesClient:
         Returns a mapping of series slugs to their names.
         """
         try:
-            response = self._http_client().get(Endpoints.SERIES_LIST.value)
+            response = self._http_client().get(_SERIES_LIST)
             response.raise_for_status()
             data = response.json()
             return data
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_list", Endpoints.SERIES_LIST.value)
+            raise handle_http_error(e, "series_list", _SERIES_LIST)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def create(self, name: str, pattern: str) -> SeriesInfo:
         try:
-            response = self._http_client().post(Endpoints.SERIES_CREATE.value, json={"name": name, "pattern": pattern})
+            response = self._http_client().post(_SERIES_CREATE, **json_request_args({"name": name, "pattern": pattern}))
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            self._metadata_cache.invalidate()
+            return SeriesInfo.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_create", Endpoints.SERIES_CREATE.value)
+            raise handle_http_error(e, "series_create", _SERIES_CREATE)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def update(self, name: str, pattern: str) -> SeriesInfo:
         try:
             response = self._http_client().put(
-                Endpoints.SERIES_UPDATE.value, json={"series": self._series, "name": name, "pattern": pattern}
+                _SERIES_UPDATE, **json_request_args({"series": self._series, "name": name, "pattern": pattern})
             )
             response.raise_for_status()
-            data = response.json()
-            return SeriesInfo.from_dict(data)
+            self._metadata_cache.invalidate()
+            return SeriesInfo.model_validate_json(response.content)
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_update", Endpoints.SERIES_UPDATE.value)
+            raise handle_http_error(e, "series_update", _SERIES_UPDATE)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def delete(self) -> None:
         try:
             response = self._http_client().request(
                 "DELETE",
-                Endpoints.SERIES_DELETE.value,
-                json={"series": self._series},
+                _SERIES_DELETE,
+                **json_request_args({"series": self._series}),
             )
             response.raise_for_status()
+            self._metadata_cache.invalidate()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_delete", Endpoints.SERIES_DELETE.value)
+            raise handle_http_error(e, "series_delete", _SERIES_DELETE)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def reset(self) -> None:
@@ -275,20 +335,31 @@ class SeriesClient:
             req = {}
             if self._series:
                 req["series"] = self._series
-            response = self._http_client().post(Endpoints.RESET.value, json=req)
+            response = self._http_client().post(_RESET, **json_request_args(req))
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "series_reset", Endpoints.RESET.value)
+            raise handle_http_error(e, "series_reset", _RESET)
 
 
 class SyncClient:
+    """Sync SlugKit API client backed by one shared httpx client.
+
+    HTTP/2 is enabled by default; httpx negotiates the protocol via ALPN
+    and falls back to HTTP/1.1 when the server does not speak h2.
+    """
+
     def __init__(
         self,
         base_url: str,
         api_key: str | None = None,
         *,
         httpx_client_factory: Callable[[], Any] = httpx.Client,
-        timeout: float = 10.0,
+        timeout: float | httpx.Timeout = 10.0,
+        http2: bool = True,
+        max_connections: int = 100,
+        max_keepalive_connections: int = 20,
+        keepalive_expiry: float = 30.0,
+        limits: httpx.Limits | None = None,
     ):
         if not base_url:
             base_url = os.getenv("SLUGKIT_BASE_URL")
@@ -300,13 +371,42 @@ class SyncClient:
         self._api_key = api_key
         self._httpx_client_factory = httpx_client_factory
         self._timeout = timeout
+        self._http2 = http2
+        self._limits = limits or httpx.Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        )
+        self._client: httpx.Client | None = None
+        self._metadata_cache = _TTLCache()
 
     def _http_client(self) -> httpx.Client:
-        return self._httpx_client_factory(
-            base_url=self.base_url,
-            headers={"x-api-key": self._api_key},
-            timeout=self._timeout,
-        )
+        """Return the shared httpx client, creating it on first use.
+
+        Reusing a single pooled client keeps TLS sessions and keep-alive
+        connections alive across requests instead of paying a fresh
+        handshake per call.
+        """
+        if self._client is None or self._client.is_closed:
+            self._client = self._httpx_client_factory(
+                base_url=self.base_url,
+                headers={"x-api-key": self._api_key},
+                timeout=self._timeout,
+                http2=self._http2,
+                limits=self._limits,
+            )
+        return self._client
+
+    def close(self) -> None:
+        """Close the shared httpx client and its connection pool."""
+        if self._client is not None and not self._client.is_closed:
+            self._client.close()
+
+    def __enter__(self) -> "SyncClient":
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
 
     def _create_error_context(self, operation: str, endpoint: str = None, **kwargs) -> ErrorContext:
         """Create error context for better error reporting."""
@@ -315,20 +415,24 @@ class SyncClient:
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def ping(self) -> None:
         try:
-            response = self._http_client().get(Endpoints.PING.value)
+            response = self._http_client().get(_PING)
             response.raise_for_status()
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "ping", Endpoints.PING.value)
+            raise handle_http_error(e, "ping", _PING)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def key_info(self) -> KeyInfo:
+        cached = self._metadata_cache.get(_KEY_INFO)
+        if cached is not None:
+            return cached
         try:
-            response = self._http_client().post(Endpoints.KEY_INFO.value)
+            response = self._http_client().post(_KEY_INFO)
             response.raise_for_status()
-            data = response.json()
-            return KeyInfo.from_dict(data)
+            info = KeyInfo.model_validate_json(response.content)
+            self._metadata_cache.set(_KEY_INFO, info, cache_ttl_from_headers(response.headers))
+            return info
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "key_info", Endpoints.KEY_INFO.value)
+            raise handle_http_error(e, "key_info", _KEY_INFO)
 
     @retry_with_backoff(max_attempts=3, base_delay=1.0)
     def limits(self) -> SubscriptionFeatures:
@@ -337,13 +441,17 @@ class SyncClient:
         Returns:
             SubscriptionFeatures: The subscription limits and features
         """
+        cached = self._metadata_cache.get(_LIMITS)
+        if cached is not None:
+            return cached
         try:
-            response = self._http_client().get(Endpoints.LIMITS.value)
+            response = self._http_client().get(_LIMITS)
             response.raise_for_status()
-            data = response.json()
-            return SubscriptionFeatures.from_dict(data)
+            features = SubscriptionFeatures.model_validate_json(response.content)
+            self._metadata_cache.set(_LIMITS, features, cache_ttl_from_headers(response.headers))
+            return features
         except httpx.HTTPStatusError as e:
-            raise handle_http_error(e, "limits", Endpoints.LIMITS.value)
+            raise handle_http_error(e, "limits", _LIMITS)
 
     @functools.cached_property
     def series(self) -> SeriesClient:
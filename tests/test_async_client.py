@@ -1,3 +1,4 @@
+import json
 import pytest
 from unittest.mock import AsyncMock, Mock
 import httpx
@@ -6,6 +7,24 @@ from slugkit.async_client import AsyncClient, AsyncSlugGenerator, AsyncRandomGen
 from slugkit.base import StatsItem, SeriesInfo, PatternInfo, DictionaryInfo, DictionaryTag
 
 
+def mock_json_response(payload):
+    """Build a response mock that works for both JSON decode paths."""
+    mock_response = Mock()
+    mock_response.status_code = 200
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode()
+    mock_response.raise_for_status.return_value = None
+    return mock_response
+
+
+def request_json(call_args):
+    """Extract the JSON request body regardless of how it was serialized."""
+    kwargs = call_args[1]
+    if "json" in kwargs:
+        return kwargs["json"]
+    return json.loads(kwargs["content"])
+
+
 class TestAsyncClient:
     """Tests for the AsyncClient class."""
 
@@ -101,6 +120,35 @@ class TestAsyncClient:
         # Verify org_slug is not empty
         assert len(key_info.org_slug) > 0
 
+    @pytest.mark.asyncio
+    async def test_forge_metadata_cache_survives_property_access(self):
+        """Consecutive client.forge.pattern_info calls hit the API once."""
+        calls = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            calls.append(request.url.path)
+            return httpx.Response(
+                200,
+                json={
+                    "pattern": "{noun}",
+                    "capacity": "100",
+                    "max_slug_length": 10,
+                    "complexity": 1,
+                    "components": 1,
+                },
+            )
+
+        def factory(**kwargs):
+            kwargs["transport"] = httpx.MockTransport(handler)
+            return httpx.AsyncClient(**kwargs)
+
+        client = AsyncClient("http://testserver", "test-api-key", httpx_client_factory=factory)
+        first = await client.forge.pattern_info("{noun}")
+        second = await client.forge.pattern_info("{noun}")
+
+        assert first == second
+        assert len(calls) == 1
+
 
 class TestAsyncSlugGenerator:
     """Tests for the AsyncSlugGenerator class."""
@@ -183,11 +231,9 @@ class TestAsyncSlugGenerator:
     async def test_async_generator_call_method(self):
         """Test AsyncSlugGenerator __call__ method."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["test-1", "test-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncSlugGenerator(mock_http_client, series_slug="test-series")
         ids = await generator(count=2)
@@ -197,10 +243,10 @@ class TestAsyncSlugGenerator:
         assert ids == expected_ids
 
         # Verify the API was called with series configuration
-        mock_http_client.return_value.post.assert_called_once()
-        call_args = mock_http_client.return_value.post.call_args
-        assert call_args[1]["json"]["series"] == "test-series"
-        assert call_args[1]["json"]["count"] == 2
+        mock_http_client.post.assert_called_once()
+        call_args = mock_http_client.post.call_args
+        assert request_json(call_args)["series"] == "test-series"
+        assert request_json(call_args)["count"] == 2
 
 
 class TestAsyncRandomGenerator:
@@ -210,11 +256,9 @@ class TestAsyncRandomGenerator:
     async def test_async_forge_basic(self, test_pattern):
         """Test basic forge functionality."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["simple-cat-ab", "simple-dog-cd"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         ids = await generator(pattern=test_pattern, count=2)
@@ -224,20 +268,18 @@ class TestAsyncRandomGenerator:
         assert ids == expected_ids
 
         # Verify the API was called correctly
-        mock_http_client.return_value.post.assert_called_once()
-        call_args = mock_http_client.return_value.post.call_args
-        assert call_args[1]["json"]["pattern"] == test_pattern
-        assert call_args[1]["json"]["count"] == 2
+        mock_http_client.post.assert_called_once()
+        call_args = mock_http_client.post.call_args
+        assert request_json(call_args)["pattern"] == test_pattern
+        assert request_json(call_args)["count"] == 2
 
     @pytest.mark.asyncio
     async def test_async_forge_with_seed(self, test_pattern):
         """Test forge with seed parameter."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["seeded-result-1", "seeded-result-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         test_seed = "test-seed-123"
@@ -248,19 +290,17 @@ class TestAsyncRandomGenerator:
         assert ids == expected_ids
 
         # Verify the API was called with seed
-        mock_http_client.return_value.post.assert_called_once()
-        call_args = mock_http_client.return_value.post.call_args
-        assert call_args[1]["json"]["seed"] == test_seed
+        mock_http_client.post.assert_called_once()
+        call_args = mock_http_client.post.call_args
+        assert request_json(call_args)["seed"] == test_seed
 
     @pytest.mark.asyncio
     async def test_async_forge_with_sequence(self, test_pattern):
         """Test forge with sequence parameter."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["seq-100", "seq-101"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         ids = await generator(pattern=test_pattern, sequence=100, count=2)
@@ -270,26 +310,24 @@ class TestAsyncRandomGenerator:
         assert ids == expected_ids
 
         # Verify the API was called with sequence
-        mock_http_client.return_value.post.assert_called_once()
-        call_args = mock_http_client.return_value.post.call_args
-        assert call_args[1]["json"]["sequence"] == 100
+        mock_http_client.post.assert_called_once()
+        call_args = mock_http_client.post.call_args
+        assert request_json(call_args)["sequence"] == 100
 
     @pytest.mark.asyncio
     async def test_async_forge_deterministic(self, test_pattern):
         """Test that forge with same parameters returns same results."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["deterministic-1", "deterministic-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         test_seed = "deterministic-seed"
         ids1 = await generator(pattern=test_pattern, seed=test_seed, sequence=1, count=2)
 
         # Reset mock for second call
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         ids2 = await generator(pattern=test_pattern, seed=test_seed, sequence=1, count=2)
 
@@ -300,10 +338,8 @@ class TestAsyncRandomGenerator:
     async def test_async_forge_with_optional_params(self, test_pattern):
         """Test forge with various optional parameters."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
-        mock_response.json.return_value = ["simple-cat-ab"]
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(["simple-cat-ab"])
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
 
@@ -313,15 +349,14 @@ class TestAsyncRandomGenerator:
         assert len(ids) == 1
 
         # Verify the API was called with correct parameters
-        call_args = mock_http_client.return_value.post.call_args
-        assert call_args[1]["json"]["pattern"] == test_pattern
-        assert call_args[1]["json"]["count"] == 1
+        call_args = mock_http_client.post.call_args
+        assert request_json(call_args)["pattern"] == test_pattern
+        assert request_json(call_args)["count"] == 1
 
     @pytest.mark.asyncio
     async def test_async_pattern_info(self, test_pattern):
         """Test getting pattern information asynchronously."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_pattern_info = {
             "pattern": "test-{adjective}-{noun}-{number:3d}",
             "capacity": "1000000",
@@ -329,9 +364,8 @@ class TestAsyncRandomGenerator:
             "complexity": 3,
             "components": 3,
         }
-        mock_response.json.return_value = expected_pattern_info
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_pattern_info)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         pattern_info = await generator.pattern_info(test_pattern)
@@ -347,15 +381,13 @@ class TestAsyncRandomGenerator:
     async def test_async_dictionary_info(self, test_pattern):
         """Test getting dictionary information asynchronously."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_dict_info = [
             {"kind": "adjective", "count": 1000},
             {"kind": "noun", "count": 2000},
             {"kind": "verb", "count": 1500},
         ]
-        mock_response.json.return_value = expected_dict_info
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.get = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_dict_info)
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         dict_info = await generator.dictionary_info()
@@ -371,7 +403,6 @@ class TestAsyncRandomGenerator:
     async def test_async_dictionary_tags(self, test_pattern):
         """Test getting dictionary tags asynchronously."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_dict_tags = [
             {
                 "kind": "adjective",
@@ -382,9 +413,8 @@ class TestAsyncRandomGenerator:
             },
             {"kind": "noun", "tag": "animals", "description": "Animal names", "opt_in": False, "word_count": 300},
         ]
-        mock_response.json.return_value = expected_dict_tags
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.get = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_dict_tags)
+        mock_http_client.get = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         dict_tags = await generator.dictionary_tags()
@@ -407,7 +437,7 @@ class TestAsyncErrorHandling:
     async def test_async_http_error_handling(self):
         """Test HTTP error handling in async operations."""
         mock_http_client = AsyncMock()
-        mock_http_client.return_value.post = AsyncMock(
+        mock_http_client.post = AsyncMock(
             side_effect=httpx.HTTPStatusError("404 Not Found", request=Mock(), response=Mock())
         )
 
@@ -423,7 +453,8 @@ class TestAsyncErrorHandling:
         mock_response = Mock()
         mock_response.json.side_effect = ValueError("Invalid JSON")
         mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response.status_code = 200
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
 
@@ -438,10 +469,8 @@ class TestAsyncEdgeCases:
     async def test_async_empty_response(self):
         """Test handling of empty responses."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
-        mock_response.json.return_value = []
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response([])
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         ids = await generator(pattern="test-{noun}", count=5)
@@ -453,10 +482,8 @@ class TestAsyncEdgeCases:
     async def test_async_large_count(self):
         """Test handling of large count values."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
-        mock_response.json.return_value = ["slug"] * 1000
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(["slug"] * 1000)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         generator = AsyncRandomGenerator(mock_http_client)
         ids = await generator(pattern="test-{noun}", count=1000)
@@ -473,14 +500,13 @@ class TestAsyncIntegration:
     async def test_async_client_mint_operation(self):
         """Test async minting via client.series.mint."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["mint-1", "mint-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         client = AsyncClient("http://localhost:8000", "test-api-key")
-        client._http_client = mock_http_client
+        mock_http_client.is_closed = False
+        client._client = mock_http_client
 
         ids = await client.series.mint(count=2)
 
@@ -492,14 +518,13 @@ class TestAsyncIntegration:
     async def test_async_client_slice_operation(self):
         """Test async slicing via client.series.slice."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["slice-1", "slice-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         client = AsyncClient("http://localhost:8000", "test-api-key")
-        client._http_client = mock_http_client
+        mock_http_client.is_closed = False
+        client._client = mock_http_client
 
         ids = await client.series.slice(count=2)
 
@@ -511,14 +536,13 @@ class TestAsyncIntegration:
     async def test_async_client_forge_operation(self):
         """Test async forging via client.forge."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["forge-1", "forge-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         client = AsyncClient("http://localhost:8000", "test-api-key")
-        client._http_client = mock_http_client
+        mock_http_client.is_closed = False
+        client._client = mock_http_client
 
         ids = await client.forge(pattern="test-{noun}", count=2)
 
@@ -530,14 +554,13 @@ class TestAsyncIntegration:
     async def test_async_client_series_access(self):
         """Test accessing specific series via client.series['slug']."""
         mock_http_client = AsyncMock()
-        mock_response = Mock()
         expected_ids = ["series-1", "series-2"]
-        mock_response.json.return_value = expected_ids
-        mock_response.raise_for_status.return_value = None
-        mock_http_client.return_value.post = AsyncMock(return_value=mock_response)
+        mock_response = mock_json_response(expected_ids)
+        mock_http_client.post = AsyncMock(return_value=mock_response)
 
         client = AsyncClient("http://localhost:8000", "test-api-key")
-        client._http_client = mock_http_client
+        mock_http_client.is_closed = False
+        client._client = mock_http_client
 
         series_client = client.series["test-series"]
         ids = await series_client.mint(count=2)
@@ -550,12 +573,13 @@ class TestAsyncIntegration:
     async def test_async_client_error_handling(self):
         """Test HTTP error handling in async client operations."""
         mock_http_client = AsyncMock()
-        mock_http_client.return_value.post = AsyncMock(
+        mock_http_client.post = AsyncMock(
             side_effect=httpx.HTTPStatusError("500 Internal Server Error", request=Mock(), response=Mock())
         )
 
         client = AsyncClient("http://localhost:8000", "test-api-key")
-        client._http_client = mock_http_client
+        mock_http_client.is_closed = False
+        client._client = mock_http_client
 
         with pytest.raises(httpx.HTTPStatusError):
             await client.series.mint(count=1)
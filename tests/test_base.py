@@ -0,0 +1,106 @@
+"""
+Tests for the pure helper primitives in slugkit.base.
+
+These cover the streaming line splitter/decoder, the Cache-Control TTL
+parser and the metadata TTL cache, none of which need a live API.
+"""
+
+import httpx
+
+from slugkit.base import (
+    DEFAULT_METADATA_TTL,
+    _TTLCache,
+    cache_ttl_from_headers,
+    decode_stream_lines,
+    split_stream_lines,
+)
+
+
+class TestSplitStreamLines:
+    """Test splitting streamed chunks into complete lines."""
+
+    def test_complete_lines_split(self):
+        """Complete lines come out; the trailing partial is carried over."""
+        lines, rest = split_stream_lines(bytearray(), b"a\nb\nc")
+        assert lines == [b"a", b"b"]
+        assert rest == bytearray(b"c")
+
+    def test_partial_chunk_carried_over(self):
+        """A chunk without a newline yields nothing and is buffered whole."""
+        lines, rest = split_stream_lines(bytearray(), b"partial")
+        assert lines == []
+        assert rest == bytearray(b"partial")
+
+    def test_buffer_prepended_to_chunk(self):
+        """The carried-over partial joins the next chunk's first line."""
+        lines, rest = split_stream_lines(bytearray(b"par"), b"tial\nnext")
+        assert lines == [b"partial"]
+        assert rest == bytearray(b"next")
+
+    def test_trailing_newline_leaves_empty_rest(self):
+        """A chunk ending on a newline leaves no carry-over."""
+        lines, rest = split_stream_lines(bytearray(), b"a\nb\n")
+        assert lines == [b"a", b"b"]
+        assert rest == bytearray()
+
+
+class TestDecodeStreamLines:
+    """Test decoding split lines into slugs."""
+
+    def test_decodes_and_drops_empty_lines(self):
+        assert decode_stream_lines([b"a", b"", b"b"]) == ["a", "b"]
+
+    def test_strips_trailing_carriage_return(self):
+        assert decode_stream_lines([b"slug\r", b"\r"]) == ["slug"]
+
+    def test_non_ascii_pattern_literals(self):
+        """Patterns may embed arbitrary literal text, including non-ASCII."""
+        assert decode_stream_lines(["café-apple".encode()]) == ["café-apple"]
+
+
+class TestCacheTtlFromHeaders:
+    """Test deriving cache TTLs from Cache-Control headers."""
+
+    def test_max_age_parsed(self):
+        headers = httpx.Headers({"cache-control": "public, max-age=120"})
+        assert cache_ttl_from_headers(headers) == 120.0
+
+    def test_missing_header_uses_default(self):
+        assert cache_ttl_from_headers(httpx.Headers()) == DEFAULT_METADATA_TTL
+
+    def test_malformed_max_age_uses_default(self):
+        headers = httpx.Headers({"cache-control": "max-age=soon"})
+        assert cache_ttl_from_headers(headers, default=5.0) == 5.0
+
+
+class TestTTLCache:
+    """Test the metadata TTL cache."""
+
+    def test_set_get_roundtrip(self):
+        cache = _TTLCache()
+        cache.set("key", "value")
+        assert cache.get("key") == "value"
+
+    def test_missing_key_returns_none(self):
+        assert _TTLCache().get("absent") is None
+
+    def test_expired_entry_dropped(self):
+        cache = _TTLCache()
+        cache.set("key", "value", ttl=0.0)
+        assert cache.get("key") is None
+
+    def test_invalidate_single_key(self):
+        cache = _TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate("a")
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+
+    def test_invalidate_all(self):
+        cache = _TTLCache()
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.invalidate()
+        assert cache.get("a") is None
+        assert cache.get("b") is None
@@ -171,3 +171,106 @@ def test_cli_validate(monkeypatch):
     expected_keys = ["pattern", "capacity", "max_slug_length", "complexity", "components"]
     for key in expected_keys:
         assert key in data
+
+
+def test_parallel_slice_iter_request_bodies():
+    """Each parallel batch must carry its own sequence offset and count."""
+    import httpx
+
+    from slugkit.cli import _parallel_slice_iter
+    from slugkit.sync_client import SyncSlugGenerator
+
+    bodies = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        bodies.append(body)
+        start = body.get("sequence", 0)
+        return httpx.Response(200, json=[f"s-{start + i}" for i in range(body["count"])])
+
+    http_client = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://testserver")
+    slice_gen = SyncSlugGenerator(lambda: http_client, dry_run=True)
+
+    slugs = list(_parallel_slice_iter(slice_gen, sequence=10, count=4, batch_size=2, workers=2))
+
+    assert slugs == ["s-10", "s-11", "s-12", "s-13"]
+    assert sorted(bodies, key=lambda b: b["sequence"]) == [
+        {"count": 2, "sequence": 10},
+        {"count": 2, "sequence": 12},
+    ]
+
+
+def test_print_lines_text_fallback(capsys):
+    """Without a binary buffer the slugs still come out one per line."""
+    from slugkit.cli import _print_lines
+
+    _print_lines(iter(["a", "b", "c"]))
+    assert capsys.readouterr().out == "a\nb\nc\n"
+
+
+def test_print_lines_binary_path(monkeypatch):
+    """With a binary buffer the slugs are written as newline-joined bytes."""
+    import io
+
+    from slugkit.cli import _print_lines
+
+    raw = io.BytesIO()
+    monkeypatch.setattr(sys, "stdout", io.TextIOWrapper(raw, encoding="utf-8"))
+    _print_lines(iter(["a", "b"]))
+    assert raw.getvalue() == b"a\nb\n"
+
+
+def test_print_ndjson_one_document_per_line(capsys):
+    from slugkit.cli import _print_ndjson
+
+    _print_ndjson(iter(["a", "b"]))
+    assert capsys.readouterr().out == '"a"\n"b"\n'
+
+
+def test_print_json_stream_emits_valid_array(capsys):
+    from slugkit.cli import _print_json_stream
+
+    _print_json_stream(iter(["a", "b"]))
+    assert json.loads(capsys.readouterr().out) == ["a", "b"]
+
+
+def test_print_json_stream_empty_input(capsys):
+    from slugkit.cli import _print_json_stream
+
+    _print_json_stream(iter([]))
+    assert json.loads(capsys.readouterr().out) == []
+
+
+def test_print_json_serializes_models(capsys):
+    """DTO models go through to_dict() via the default hook."""
+    from slugkit.cli import _print_json
+
+    info = PatternInfo(
+        pattern="{noun}",
+        capacity="100",
+        max_slug_length=10,
+        complexity=1,
+        components=1,
+    )
+    _print_json(info)
+    data = json.loads(capsys.readouterr().out)
+    assert data["pattern"] == "{noun}"
+    assert data["components"] == 1
+
+
+def test_prefetch_iter_preserves_items_and_order():
+    from slugkit.cli import prefetch_iter
+
+    items = [f"s-{i}" for i in range(3000)]
+    assert list(prefetch_iter(iter(items), chunk_size=256)) == items
+
+
+def test_prefetch_iter_propagates_producer_errors():
+    from slugkit.cli import prefetch_iter
+
+    def produce():
+        yield "ok"
+        raise RuntimeError("producer failed")
+
+    with pytest.raises(RuntimeError, match="producer failed"):
+        list(prefetch_iter(produce()))
@@ -7,6 +7,8 @@ and error classification for retryable vs non-retryable errors.
 
 import pytest
 import time
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
 from unittest.mock import Mock, patch
 import httpx
 
@@ -21,6 +23,7 @@ from slugkit.base import (
     calculate_backoff_delay,
     retry_with_backoff,
 )
+from slugkit.errors import _parse_retry_after_header
 
 
 class TestExceptionHierarchy:
@@ -120,6 +123,36 @@ class TestBackoffCalculation:
         # Should have some variation due to jitter
         assert len(set(delays)) > 1
 
+    def test_backoff_respects_server_retry_after(self):
+        """Test that a server-provided retry_after overrides the computed delay."""
+        assert calculate_backoff_delay(1, base_delay=1.0, retry_after=42) == 42.0
+        # A non-positive value falls back to exponential backoff
+        assert calculate_backoff_delay(1, base_delay=1.0, retry_after=0) != 0.0
+
+
+class TestRetryAfterHeaderParsing:
+    """Test parsing of the Retry-After header."""
+
+    def test_integer_seconds(self):
+        assert _parse_retry_after_header("17") == 17
+
+    def test_http_date(self):
+        """An HTTP-date value resolves to seconds from now."""
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        parsed = _parse_retry_after_header(format_datetime(when, usegmt=True))
+        assert parsed is not None
+        assert 25 <= parsed <= 30
+
+    def test_past_http_date_clamps_to_zero(self):
+        when = datetime.now(timezone.utc) - timedelta(seconds=30)
+        assert _parse_retry_after_header(format_datetime(when, usegmt=True)) == 0
+
+    def test_unparseable_value_returns_none(self):
+        assert _parse_retry_after_header("soon") is None
+
+    def test_missing_value_returns_none(self):
+        assert _parse_retry_after_header(None) is None
+
 
 class TestRetryDecorator:
     """Test the retry decorator functionality."""
@@ -1,3 +1,5 @@
+import json
+
 import pytest
 import httpx
 from unittest.mock import Mock, patch
@@ -469,3 +471,39 @@ class TestEdgeCases:
         except (httpx.HTTPStatusError, ValueError):
             # Expected behavior for invalid patterns
             pass
+
+
+class TestSliceRequestBodies:
+    """Request-body contracts for the dry-run (slice) batch path."""
+
+    @staticmethod
+    def _recording_client(requests: list[dict]):
+        """A pooled-client factory backed by a transport that records bodies."""
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            body = json.loads(request.content)
+            requests.append(body)
+            start = body.get("sequence", 0)
+            return httpx.Response(200, json=[f"slug-{start + i}" for i in range(body["count"])])
+
+        client = httpx.Client(transport=httpx.MockTransport(handler), base_url="http://testserver")
+        return lambda: client
+
+    def test_slice_call_forwards_sequence(self):
+        """__call__ must send the sequence configured via starting_from."""
+        requests: list[dict] = []
+        generator = SyncSlugGenerator(self._recording_client(requests), dry_run=True)
+
+        slugs = generator.starting_from(10)(count=2)
+
+        assert slugs == ["slug-10", "slug-11"]
+        assert requests == [{"count": 2, "sequence": 10}]
+
+    def test_slice_call_without_sequence_defaults_to_zero(self):
+        """An unconfigured generator still pins the default start of the series."""
+        requests: list[dict] = []
+        generator = SyncSlugGenerator(self._recording_client(requests), dry_run=True)
+
+        generator(count=3)
+
+        assert requests == [{"count": 3, "sequence": 0}]